@@ -1,8 +1,17 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
-from .routes import admin, auth
+from .routes import admin, auth, debug
 
-api_router = APIRouter(prefix="/api")
+from app.core.config import settings
+from app.utils.responses import FastJSONResponse
+
+api_router = APIRouter(
+    prefix="/api",
+    default_response_class=FastJSONResponse if settings.API_FAST_JSON_RESPONSE else JSONResponse)
 
 api_router.include_router(admin.router, tags=["admin"])
 api_router.include_router(auth.router, tags=["auth"])
+
+if settings.DB_QUERY_LOG_ENABLED:
+    api_router.include_router(debug.router, tags=["debug"])
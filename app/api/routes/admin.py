@@ -1,20 +1,28 @@
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Response, Depends, Query
 from fastapi import status
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.sql import delete, and_, or_
 
 from wtforms import Form
 
-from app.core.admin.internal import get_model, get_form_class, get_primary_key_names, get_validated_primary_entries
+from app.core.admin.internal import get_model, get_form_class, get_primary_key_form_class, get_primary_key_names, get_validated_primary_entries
 
-from app.core.admin.internal import identity_exists
+from app.core.admin.internal import identity_exists, get_columns, get_column_names, get_formatters, get_keyset_keys, get_select_from
+from app.core.admin.versions import mark_model_changed, ADMIN_WRITE_STAMP_COOKIE
+from app.core.admin.bulk import read_bulk_rows, validate_row, copy_available, insert_rows, update_rows, delete_rows
+from app.core.admin.export import export_rows, EXPORT_MEDIA_TYPES
+from app.core.cache import invalidate_cached_user
+from app.database.models import User
 from app.core.config import settings
 from app.dependencies import DBDependency, get_current_admin_user
+from app.schemas import BulkCreateResult, BulkUpdateResult, BatchDeleteResult
+from app.utils.responses import model_json_response
 
 import logging
+import time
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -23,8 +31,18 @@ router = APIRouter(prefix=settings.ADMIN_BASE_URL,
                    dependencies=[Depends(get_current_admin_user), Depends(identity_exists)])
 
 
+def _mark_changed(identity: str, response: Response) -> None:
+    mark_model_changed(identity)
+    # Changes this client's list page ETags, so its next page load is rendered
+    # fresh whichever worker serves it.
+    response.set_cookie(ADMIN_WRITE_STAMP_COOKIE,
+                        str(time.time_ns()), httponly=True)
+
+
 @router.post("/{identity}/create", name='admin_create')
 async def create_item(request: Request,
+                      identity: str,
+                      response: Response,
                       db: DBDependency,
                       model=Depends(get_model),
                       form_cls=Depends(get_form_class),
@@ -54,11 +72,111 @@ async def create_item(request: Request,
         logger.error(e)
         raise HTTPException(status_code=400, detail="Integrity error")
 
+    _mark_changed(identity, response)
+
     return {"detail": "Item created successfully"}
 
 
+@router.post("/{identity}/bulk_create", name='admin_bulk_create', response_model=BulkCreateResult)
+async def bulk_create_items(request: Request,
+                            identity: str,
+                            db: DBDependency,
+                            model=Depends(get_model),
+                            form_cls=Depends(get_form_class),
+                            chunk_size: Optional[int] = Query(
+                                None, ge=1, le=100000),
+                            use_copy: bool = Query(True),
+                            ):
+    """
+    Create rows from a JSON array or a CSV document (Content-Type: text/csv).
+    Each row is validated with the registered form; valid rows are written in
+    chunks with COPY when available and multi-row INSERTs otherwise.
+    """
+    try:
+        rows = await read_bulk_rows(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    valid_rows = []
+    errors = []
+    for index, row in enumerate(rows):
+        data, row_errors = validate_row(form_cls, row)
+        if row_errors:
+            errors.append({"row": index, "errors": row_errors})
+        else:
+            valid_rows.append((index, data))
+
+    created, write_errors = await insert_rows(
+        db, model, valid_rows,
+        chunk_size=chunk_size or settings.ADMIN_BULK_CHUNK_SIZE,
+        use_copy=use_copy and copy_available(db))
+    await db.commit()
+
+    errors.extend(write_errors)
+    errors.sort(key=lambda error: error["row"])
+    response = model_json_response(BulkCreateResult(
+        detail=f"{created} items created successfully", created=created, errors=errors))
+    if created:
+        _mark_changed(identity, response)
+    return response
+
+
+@router.put("/{identity}/bulk_update", name='admin_bulk_update', response_model=BulkUpdateResult)
+async def bulk_update_items(request: Request,
+                            identity: str,
+                            db: DBDependency,
+                            model=Depends(get_model),
+                            form_cls=Depends(get_form_class),
+                            primary_key_form_cls=Depends(
+                                get_primary_key_form_class),
+                            chunk_size: Optional[int] = Query(
+                                None, ge=1, le=100000),
+                            ):
+    """
+    Update rows from a JSON array or a CSV document. Each row carries its
+    primary key values alongside the fields of the registered form.
+    """
+    try:
+        rows = await read_bulk_rows(request)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    valid_rows = []
+    errors = []
+    for index, row in enumerate(rows):
+        primary_entries, primary_key_errors = validate_row(
+            primary_key_form_cls, row)
+        data, row_errors = validate_row(form_cls, row)
+        if primary_key_errors or row_errors:
+            errors.append(
+                {"row": index, "errors": {**(primary_key_errors or {}), **(row_errors or {})}})
+        else:
+            valid_rows.append((index, {**data, **primary_entries}))
+
+    primary_key_names = [
+        column.name for column in model.__table__.primary_key.columns]
+    updated, write_errors = await update_rows(
+        db, model, primary_key_names, valid_rows,
+        chunk_size=chunk_size or settings.ADMIN_BULK_CHUNK_SIZE)
+    await db.commit()
+
+    errors.extend(write_errors)
+    errors.sort(key=lambda error: error["row"])
+    response = model_json_response(BulkUpdateResult(
+        detail=f"{updated} items updated successfully", updated=updated, errors=errors))
+    if updated:
+        _mark_changed(identity, response)
+        if model is User:
+            invalidate_cached_user()
+    return response
+
+
 @router.delete("/{identity}", name='admin_delete')
 async def delete_item(primary_keys: Dict[str, Any],
+                      identity: str,
+                      response: Response,
                       db: DBDependency,
                       model=Depends(get_model),
                       ):
@@ -74,6 +192,8 @@ async def delete_item(primary_keys: Dict[str, Any],
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
+    username = obj.username if isinstance(obj, User) else None
+
     # Delete the item
     await db.delete(obj)
     try:
@@ -84,38 +204,41 @@ async def delete_item(primary_keys: Dict[str, Any],
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Integrity error during deletion")
 
+    _mark_changed(identity, response)
+    if username is not None:
+        invalidate_cached_user(username)
+
     return {"detail": "Item deleted successfully"}
 
 
-@router.delete("/{identity}/batch_delete", name='admin_batch_delete')
+@router.delete("/{identity}/batch_delete", name='admin_batch_delete', response_model=BatchDeleteResult)
 async def delete_items(
     primary_keys_list: List[Dict[str, Any]],
+    identity: str,
     db: DBDependency,
     model=Depends(get_model),
     primary_key_names=Depends(get_primary_key_names),
+    primary_key_form_cls=Depends(get_primary_key_form_class),
 ):
     if not primary_keys_list or any(not pk for pk in primary_keys_list):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid primary key list provided"
         )
 
-    # Validate and build the filters to match all items in the provided primary keys list
-    filters = [
-        and_(*(getattr(model, key) == value for key,
-             value in pk.items() if key in primary_key_names))
-        for pk in primary_keys_list
-    ]
-
-    if not filters:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="No valid primary keys provided"
-        )
-
-    stmt = delete(model).where(or_(*filters))
+    # Validate and coerce the primary keys, dropping duplicates
+    keys = {}
+    for pk in primary_keys_list:
+        primary_entries, errors = validate_row(primary_key_form_cls, {
+            key: value for key, value in pk.items() if key in primary_key_names})
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No valid primary keys provided"
+            )
+        keys[tuple(primary_entries[name] for name in primary_key_names)] = None
 
     try:
-        result = await db.execute(stmt)
-        if result.rowcount == 0:
+        deleted = await delete_rows(db, model.__table__, primary_key_names, list(keys))
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="No items matched the provided primary keys"
             )
@@ -127,12 +250,23 @@ async def delete_items(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Integrity error during batch deletion"
         )
 
-    return {"detail": f"{result.rowcount} items deleted successfully"}
+    missing = keys.keys() - set(deleted)
+    response = model_json_response(BatchDeleteResult(
+        detail=f"{len(deleted)} items deleted successfully",
+        deleted=len(deleted),
+        missing=[dict(zip(primary_key_names, key)) for key in missing],
+    ))
+    _mark_changed(identity, response)
+    if model is User:
+        invalidate_cached_user()
+    return response
 
 
 @router.put("/{identity}/update", name='admin_update')
 async def update_item(
     request: Request,
+    identity: str,
+    response: Response,
     db: DBDependency,
     model=Depends(get_model),
     form_cls=Depends(get_form_class),
@@ -144,6 +278,8 @@ async def update_item(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
+    username = obj.username if isinstance(obj, User) else None
+
     form: Form = form_cls(await request.form())
 
     if not form.validate():
@@ -167,4 +303,24 @@ async def update_item(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Integrity error")
 
+    _mark_changed(identity, response)
+    if username is not None:
+        invalidate_cached_user(username)
+
     return {"detail": "Item updated successfully"}
+
+
+@router.get("/{identity}/export", name='admin_export')
+async def export_items(identity: str,
+                       format: Literal["csv", "ndjson"] = Query("csv"),
+                       ):
+    stream = export_rows(
+        get_columns(identity),
+        get_column_names(identity),
+        get_formatters(identity),
+        get_keyset_keys(identity),
+        export_format=format,
+        select_from=get_select_from(identity),
+    )
+    return StreamingResponse(stream, media_type=EXPORT_MEDIA_TYPES[format], headers={
+        "Content-Disposition": f'attachment; filename="{identity}.{format}"'})
@@ -7,15 +7,14 @@ from fastapi.responses import HTMLResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 
-from app.dependencies import DBDependency, TokenDependency, CurrentUser
+from app.dependencies import DBDependency, ReadDBDependency, TokenDependency, CurrentUser
 
 from app import schemas
 from app.utils.forms import RegistrationForm
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.core import security
 from app.core.config import settings
-from app.core.security import get_password_hash
-from app.database.crud import get_user_by_email, get_user_by_username, create_user
+from app.database.crud import get_user_by_email, get_user_by_username, create_user, UserAlreadyExistsError
 
 
 router = APIRouter()
@@ -23,7 +22,7 @@ router = APIRouter()
 
 @router.post("/login/access-token", name="login_access_token", response_model=schemas.Token)
 async def login_access_token(
-    db: DBDependency, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
+    db: ReadDBDependency, form_data: Annotated[OAuth2PasswordRequestForm, Depends()]
 ):
 
     db_user = await get_user_by_username(db, form_data.username)
@@ -32,7 +31,7 @@ async def login_access_token(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect username or password")
 
-    if not security.verify_password(form_data.password, db_user.hashed_password):
+    if not await security.verify_password_async(form_data.password, db_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect username or password")
 
@@ -60,16 +59,17 @@ async def register(request: Request, db: DBDependency):
 
     data = form.data
 
-    user = await create_user(db=db,
-                             username=data['username'],
-                             full_name=data["full_name"],
-                             hashed_password=get_password_hash(
-                                 data['password']),
-                             email=data['email'],
-                             )
+    hashed_password = await get_password_hash_async(data['password'])
 
-    if not user:
+    try:
+        user = await create_user(db=db,
+                                 username=data['username'],
+                                 full_name=data["full_name"],
+                                 hashed_password=hashed_password,
+                                 email=data['email'],
+                                 )
+    except UserAlreadyExistsError as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists")
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return user
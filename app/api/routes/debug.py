@@ -0,0 +1,19 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from app.database.query_log import get_query_log_report
+from app.dependencies import get_current_admin_user
+
+
+router = APIRouter(prefix="/debug",
+                   dependencies=[Depends(get_current_admin_user)])
+
+
+@router.get("/queries", name="debug_queries")
+async def read_query_log() -> Dict[str, Any]:
+    """
+    Recent slow statements and requests that issued the same normalized
+    statement repeatedly (likely N+1 lazy loads). Kept per worker.
+    """
+    return get_query_log_report()
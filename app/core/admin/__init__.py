@@ -1,4 +1,8 @@
 from .internal import (
     register_admin_model_view,
-    AdminListSortOrder
+    AdminListSortOrder,
+    AdminListPaginationMode,
+    AdminListCountStrategy,
+    AdminListFetchStrategy,
+    AdminListUnindexedSortPolicy,
 )
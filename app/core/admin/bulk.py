@@ -0,0 +1,194 @@
+import csv
+import io
+import json
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import asyncpg
+from sqlalchemy import ARRAY, Table, any_, bindparam, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql import delete, insert, select, update
+from starlette.datastructures import ImmutableMultiDict
+from starlette.requests import Request
+
+from wtforms import Form
+
+
+_ROW_T = Tuple[int, Dict[str, Any]]
+
+# PostgreSQL's wire protocol allows at most 32767 bind parameters per statement.
+_MAX_BIND_PARAMETERS = 32767
+
+
+async def read_bulk_rows(request: Request) -> List[Dict[str, Any]]:
+    """
+    Parse the request body as a CSV document (Content-Type: text/csv) or a
+    JSON array of objects.
+
+    Raises ValueError if the body is malformed.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+
+    if content_type.startswith("text/csv"):
+        try:
+            return list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise ValueError(f"Invalid CSV: {e}")
+
+    try:
+        rows = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(rows, list) or any(not isinstance(row, dict) for row in rows):
+        raise ValueError("Expected a JSON array of objects")
+    return rows
+
+
+def _to_form_value(value: Any) -> str:
+    # Mirror what a browser would submit for the field.
+    if isinstance(value, bool):
+        return "True" if value else "False"
+    return str(value)
+
+
+def validate_row(form_cls: Form, row: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Validate one row with a registered form class, returning (data, None) on
+    success and (None, errors) otherwise.
+    """
+    formdata = ImmutableMultiDict([(key, _to_form_value(value))
+                                   for key, value in row.items() if value is not None])
+    form: Form = form_cls(formdata)
+    if not form.validate():
+        return None, form.errors
+    return form.data, None
+
+
+def _chunks(rows: Sequence[_ROW_T], chunk_size: int):
+    for i in range(0, len(rows), chunk_size):
+        yield rows[i:i + chunk_size]
+
+
+def copy_available(db: AsyncSession) -> bool:
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+async def _copy_chunk(db: AsyncSession, model: DeclarativeBase, chunk: Sequence[_ROW_T]) -> None:
+    table = model.__table__
+    columns = list(chunk[0][1].keys())
+    connection = await db.connection()
+    # COPY hands values straight to the driver, so run the bind processing
+    # an INSERT would apply (EmailType lower-casing, Enum names, ...).
+    dialect = connection.dialect
+    processors = [table.c[column].type.bind_processor(dialect)
+                  for column in columns]
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(data.get(column) if processor is None else processor(data.get(column))
+                       for column, processor in zip(columns, processors))
+                 for _, data in chunk],
+        columns=columns,
+        schema_name=table.schema,
+    )
+
+
+async def insert_rows(db: AsyncSession, model: DeclarativeBase, rows: Sequence[_ROW_T], chunk_size: int, use_copy: bool = False) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Insert validated rows in chunks, each inside its own savepoint, so a failing
+    chunk is reported without discarding the others. Returns the number of rows
+    written and the errors of the failed chunks.
+    """
+    created = 0
+    errors = []
+
+    for chunk in _chunks(rows, chunk_size):
+        try:
+            async with db.begin_nested():
+                if use_copy:
+                    await _copy_chunk(db, model, chunk)
+                else:
+                    await db.execute(insert(model), [data for _, data in chunk])
+            created += len(chunk)
+        # COPY bypasses SQLAlchemy, so asyncpg's own errors surface as is;
+        # values it cannot encode (an int4 out of range, ...) raise
+        # InterfaceError subclasses before reaching the server.
+        except (SQLAlchemyError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            errors.extend({"row": index, "errors": str(e)}
+                          for index, _ in chunk)
+
+    return created, errors
+
+
+async def update_rows(db: AsyncSession, model: DeclarativeBase, primary_key_names: List[str], rows: Sequence[_ROW_T], chunk_size: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Update validated rows by primary key in chunks with executemany. Rows whose
+    primary key does not exist are reported as errors.
+    """
+    updated = 0
+    errors = []
+    primary_key_columns = [getattr(model, name) for name in primary_key_names]
+
+    for chunk in _chunks(rows, chunk_size):
+        keys = [tuple(data[name] for name in primary_key_names)
+                for _, data in chunk]
+        try:
+            async with db.begin_nested():
+                result = await db.execute(
+                    select(*primary_key_columns).where(tuple_(*primary_key_columns).in_(keys)))
+                existing = {tuple(row) for row in result.all()}
+
+                found = []
+                missing = []
+                for (index, data), key in zip(chunk, keys):
+                    if key in existing:
+                        found.append(data)
+                    else:
+                        missing.append(
+                            {"row": index, "errors": "Item not found"})
+
+                if found:
+                    await db.execute(update(model), found)
+            updated += len(found)
+            errors.extend(missing)
+        except SQLAlchemyError as e:
+            errors.extend({"row": index, "errors": str(e)}
+                          for index, _ in chunk)
+
+    return updated, errors
+
+
+async def delete_rows(db: AsyncSession, table: Table, primary_key_names: List[str], keys: Sequence[Tuple[Any, ...]], use_any: Optional[bool] = None) -> List[Tuple[Any, ...]]:
+    """
+    Delete the rows whose primary key tuples are in `keys` and return the keys
+    that were actually deleted.
+
+    Composite keys are matched with a row value IN list, chunked to stay under
+    the bind parameter limit. Single-column keys on PostgreSQL are sent as one
+    array parameter and matched with `= ANY(:keys)`.
+    """
+    columns = [table.c[name] for name in primary_key_names]
+    if use_any is None:
+        use_any = db.get_bind().dialect.name == "postgresql"
+
+    deleted = []
+
+    if use_any and len(columns) == 1:
+        column = columns[0]
+        values = bindparam("primary_keys", [key[0] for key in keys],
+                           type_=ARRAY(column.type))
+        stmt = delete(table).where(column == any_(values)).returning(column)
+        result = await db.execute(stmt)
+        deleted.extend(tuple(row) for row in result.all())
+        return deleted
+
+    chunk_size = max(1, _MAX_BIND_PARAMETERS // len(columns))
+    for i in range(0, len(keys), chunk_size):
+        stmt = delete(table).where(tuple_(*columns).in_(keys[i:i + chunk_size])).returning(*columns)
+        result = await db.execute(stmt)
+        deleted.extend(tuple(row) for row in result.all())
+    return deleted
@@ -0,0 +1,47 @@
+import time
+
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# identity -> (expires_at, count)
+_cached_counts: Dict[str, Tuple[float, int]] = {}
+
+
+def get_cached_count(identity: str) -> Optional[int]:
+    entry = _cached_counts.get(identity)
+    if entry is None:
+        return None
+    expires_at, count = entry
+    if expires_at < time.monotonic():
+        _cached_counts.pop(identity, None)
+        return None
+    return count
+
+
+def set_cached_count(identity: str, count: int, ttl: float) -> None:
+    _cached_counts[identity] = (time.monotonic() + ttl, count)
+
+
+def invalidate_count(identity: str) -> None:
+    """
+    Drop the cached row count of `identity`. Called by the admin API after
+    rows are created, updated or deleted.
+    """
+    _cached_counts.pop(identity, None)
+
+
+async def estimate_count(db: AsyncSession, table: Table) -> Optional[int]:
+    """
+    Planner row estimate from `pg_class.reltuples`. Returns None when the table
+    has never been vacuumed or analyzed and no estimate is available.
+    """
+    query = text(
+        "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)")
+    result = await db.execute(query, {"table_name": table.fullname})
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+import orjson
+
+from sqlalchemy import Column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import select
+
+from app.core.config import settings
+from app.database.session import AsyncSessionLocal, AsyncReadSessionLocal
+
+from .internal import AdminListSortOrder
+from .pagination import keyset_order_by
+
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _format_csv(column_names: List[str], rows: List[List[Any]], header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(column_names)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _format_ndjson(column_names: List[str], rows: List[List[Any]]) -> Union[str, bytes]:
+    if settings.API_FAST_JSON_RESPONSE:
+        return b"".join(orjson.dumps(dict(zip(column_names, row)), default=str) + b"\n"
+                        for row in rows)
+    return "".join(json.dumps(dict(zip(column_names, row)), default=str) + "\n"
+                   for row in rows)
+
+
+async def export_rows(
+    columns: List[Column],
+    column_names: List[str],
+    formatters: Dict[Column, Callable[[Any], str]],
+    keyset_keys: List[Tuple[Column, AdminListSortOrder]],
+    export_format: str,
+    select_from: Optional[Any] = None,
+) -> AsyncIterator[Union[str, bytes]]:
+    """
+    Stream every row of a registered model as CSV or NDJSON chunks.
+
+    Rows are read through a server-side cursor one batch at a time, so memory
+    use does not depend on the table size. The session is opened here rather
+    than taken from a dependency because it must outlive the route handler.
+    """
+    row_formatters = [formatters[column] for column in columns]
+    query = select(*columns).order_by(*keyset_order_by(keyset_keys)).execution_options(
+        yield_per=settings.ADMIN_EXPORT_BATCH_SIZE)
+    if select_from is not None:
+        query = query.select_from(select_from)
+
+    session_factory = AsyncReadSessionLocal or AsyncSessionLocal
+    db: AsyncSession
+    async with session_factory() as db:
+        result = await db.stream(query)
+
+        if export_format == "csv":
+            yield _format_csv(column_names, [], header=True)
+
+        async for partition in result.partitions():
+            rows = [[formatter(value) for formatter, value in zip(row_formatters, row)]
+                    for row in partition]
+            if export_format == "csv":
+                yield _format_csv(column_names, rows, header=False)
+            else:
+                yield _format_ndjson(column_names, rows)
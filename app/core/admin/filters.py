@@ -0,0 +1,128 @@
+import datetime
+import decimal
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy import Column, or_
+from sqlalchemy.sql.elements import ColumnElement, Label
+from sqlalchemy.types import Enum, String, Integer, Boolean, DateTime, CHAR, TEXT, Date, Time, Numeric
+from sqlalchemy_utils.types.email import EmailType
+
+
+FILTER_PARAM_PREFIX = "filter_"
+
+_RANGE_KINDS = ("integer", "numeric", "date", "datetime", "time")
+
+
+def get_filter_kind(column: Column) -> Optional[str]:
+    """
+    Filter kind for a column, following the column type mapping of `get_form_field`.
+    Relationship columns are display only and have no filter kind.
+    """
+    if isinstance(column, Label):
+        return None
+    column_type = column.type
+    if isinstance(column_type, Enum):
+        return "enum"
+    elif isinstance(column_type, Integer):
+        return "integer"
+    elif isinstance(column_type, Numeric):
+        return "numeric"
+    elif isinstance(column_type, (EmailType, String, CHAR, TEXT)):
+        return "string"
+    elif isinstance(column_type, Boolean):
+        return "boolean"
+    elif isinstance(column_type, DateTime):
+        return "datetime"
+    elif isinstance(column_type, Date):
+        return "date"
+    elif isinstance(column_type, Time):
+        return "time"
+    return None
+
+
+def _coerce(column: Column, kind: str, value: str) -> Any:
+    if kind == "enum":
+        if value not in column.type.enums:
+            raise ValueError(f"Invalid choice for {column.name}: {value}")
+        enum_class = column.type.enum_class
+        return enum_class[value] if enum_class is not None else value
+    elif kind == "integer":
+        return int(value)
+    elif kind == "numeric":
+        try:
+            return decimal.Decimal(value)
+        except decimal.InvalidOperation:
+            raise ValueError(f"Invalid number for {column.name}: {value}")
+    elif kind == "boolean":
+        if value.lower() in ("true", "1"):
+            return True
+        if value.lower() in ("false", "0"):
+            return False
+        raise ValueError(f"Invalid boolean for {column.name}: {value}")
+    elif kind == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    elif kind == "date":
+        return datetime.date.fromisoformat(value)
+    elif kind == "time":
+        return datetime.time.fromisoformat(value)
+    return value
+
+
+def get_filter_fields(columns: List[Column]) -> List[Dict[str, Any]]:
+    fields = []
+    for column in columns:
+        kind = get_filter_kind(column)
+        if kind is None:
+            continue
+        fields.append({
+            "name": column.name,
+            "kind": kind,
+            "range": kind in _RANGE_KINDS,
+            "choices": list(column.type.enums) if kind == "enum" else ["True", "False"] if kind == "boolean" else [],
+        })
+    return fields
+
+
+def build_filters(columns: List[Column], params: Mapping[str, str]) -> Tuple[List[ColumnElement], Dict[str, str]]:
+    """
+    Build WHERE clauses from `filter_<column>` query parameters, plus
+    `filter_<column>__gte` / `filter_<column>__lte` for numeric and temporal
+    columns. String columns match case-insensitively on a substring.
+
+    Returns the clauses and the parameters that were applied. Raises ValueError
+    for values that cannot be coerced to the column type.
+    """
+    clauses = []
+    applied = {}
+
+    for column in columns:
+        kind = get_filter_kind(column)
+        if kind is None:
+            continue
+
+        param = FILTER_PARAM_PREFIX + column.name
+        value = params.get(param)
+        if value:
+            if kind == "string":
+                clauses.append(column.icontains(value, autoescape=True))
+            else:
+                clauses.append(column == _coerce(column, kind, value))
+            applied[param] = value
+
+        if kind in _RANGE_KINDS:
+            for suffix, op in (("__gte", column.__ge__), ("__lte", column.__le__)):
+                value = params.get(param + suffix)
+                if value:
+                    clauses.append(op(_coerce(column, kind, value)))
+                    applied[param + suffix] = value
+
+    return clauses, applied
+
+
+def build_search_clause(columns: List[Column], q: str) -> ColumnElement:
+    """
+    Case-insensitive substring match over `columns`. On PostgreSQL this is
+    served by a pg_trgm GIN index on the searched columns, if one exists.
+    """
+    return or_(*(column.icontains(q, autoescape=True) for column in columns))
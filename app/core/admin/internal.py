@@ -5,10 +5,13 @@
 
 import enum
 from app.core.config import settings
-from typing import Optional, List, Dict, Any, Tuple, Callable, Union
+from typing import Optional, List, Dict, Any, Tuple, Callable, Union, Set
 from enum import Enum
-from sqlalchemy import Column
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import Column, PrimaryKeyConstraint, Table, UniqueConstraint, inspect
+from sqlalchemy.orm import DeclarativeBase, aliased, joinedload, outerjoin
+from sqlalchemy.orm.strategy_options import Load
+from sqlalchemy.sql.elements import ColumnElement, Label
+from sqlalchemy.types import String
 
 
 from fastapi import HTTPException, Request, status
@@ -23,6 +26,7 @@ from .helpers import slugify_class_name, prettify_class_name
 
 
 from .forms import make_form, make_primary_key_form
+from .projection import RowProjector, ObjectProjector
 
 import logging
 logger = logging.getLogger(__name__)
@@ -33,8 +37,40 @@ class AdminListSortOrder(enum.Enum):
     DESCENDING = "desc"
 
 
+class AdminListPaginationMode(enum.Enum):
+    OFFSET = "offset"
+    KEYSET = "keyset"
+
+
+class AdminListCountStrategy(enum.Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+
+
+class AdminListFetchStrategy(enum.Enum):
+    """
+    How the list page rows and their exact count are fetched. WINDOW selects
+    `count(*) OVER ()` alongside the page rows in one statement; keyset views
+    fall back to CONCURRENT, which runs the count on a second connection
+    while the page is fetched.
+    """
+    SEQUENTIAL = "sequential"
+    WINDOW = "window"
+    CONCURRENT = "concurrent"
+
+
+class AdminListUnindexedSortPolicy(enum.Enum):
+    ALLOW = "allow"
+    WARN = "warn"
+    REFUSE = "refuse"
+
+
 _SORT_BY_KEY_T = Union[Tuple[Column, AdminListSortOrder], Column]
 
+# A registered column: a table column of the model, or a dotted path through
+# many-to-one relationships such as "user.username".
+_COLUMN_T = Union[Column, str]
 
 
 _models: Dict[str, DeclarativeBase] = {}
@@ -50,6 +86,19 @@ _primary_key_names: Dict[str, List[str]] = {}
 
 _sort_by_keys_dict: Dict[str,
                          List[_SORT_BY_KEY_T]] = {}
+_pagination_modes: Dict[str, AdminListPaginationMode] = {}
+_keyset_keys: Dict[str,
+                   List[Tuple[Column, AdminListSortOrder]]] = {}
+_count_strategies: Dict[str, AdminListCountStrategy] = {}
+_count_cache_ttls: Dict[str, float] = {}
+_fetch_strategies: Dict[str, AdminListFetchStrategy] = {}
+_search_columns: Dict[str, List[Column]] = {}
+_indexed_column_names: Dict[str, Set[str]] = {}
+_unindexed_sort_policies: Dict[str, AdminListUnindexedSortPolicy] = {}
+_row_projectors: Dict[str, RowProjector] = {}
+_object_projectors: Dict[str, ObjectProjector] = {}
+_select_froms: Dict[str, Any] = {}
+_load_options: Dict[str, List[Load]] = {}
 
 
 def _default_formatter(value: Any) -> Callable[[Any], str]:
@@ -58,16 +107,116 @@ def _default_formatter(value: Any) -> Callable[[Any], str]:
     return value
 
 
+def _normalize_sort_by_key(key: _SORT_BY_KEY_T) -> Tuple[Column, AdminListSortOrder]:
+    if isinstance(key, tuple):
+        return key
+    return key, AdminListSortOrder.ASCENDING
+
+
+def _make_keyset_keys(model: type, sort_by_keys: List[_SORT_BY_KEY_T]) -> List[Tuple[Column, AdminListSortOrder]]:
+    # Keyset pagination needs a total order, so the primary key columns of the
+    # table are appended as tie-breakers unless they are already sort keys.
+    keys = [_normalize_sort_by_key(key) for key in sort_by_keys]
+    for column in model.__table__.primary_key.columns:
+        if not any(column is key_column for key_column, _ in keys):
+            keys.append((column, AdminListSortOrder.ASCENDING))
+    return keys
+
+
+def _is_string_type(type_: Any) -> bool:
+    # TypeDecorators such as EmailType wrap a string type in `impl`.
+    return isinstance(type_, String) or isinstance(getattr(type_, "impl", None), String)
+
+
+def _get_indexed_column_names(table: Table) -> Set[str]:
+    # Only the leading column of an index can serve an ORDER BY on its own.
+    names = set()
+    for index in table.indexes:
+        # GIN/GiST indexes such as trigram search indexes cannot order rows.
+        using = index.dialect_options["postgresql"]["using"]
+        columns = list(index.columns)
+        if columns and using in (None, "btree"):
+            names.add(columns[0].name)
+    for constraint in table.constraints:
+        # Foreign keys are not indexed implicitly.
+        if not isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)):
+            continue
+        columns = list(constraint.columns)
+        if columns:
+            names.add(columns[0].name)
+    for column in table.columns:
+        if column.index or column.unique:
+            names.add(column.name)
+    return names
+
+
+def _resolve_relationship_columns(model: type, paths: List[str]) -> Tuple[Any, Dict[str, ColumnElement], List[Load]]:
+    """
+    Resolve dotted relationship paths into labelled columns of one LEFT OUTER
+    JOIN chain, with an aliased entity per relationship path prefix, and the
+    joinedload options that load the same paths onto an instance.
+    """
+    from_clause = model
+    aliases = {}
+    load_options = {}
+    columns = {}
+
+    for path in paths:
+        *relationship_names, column_name = path.split(".")
+        parent, parent_entity = model, model
+        for i, relationship_name in enumerate(relationship_names):
+            relationship = inspect(parent).relationships.get(relationship_name)
+            if relationship is None:
+                raise ValueError(
+                    f"{parent.__name__} has no relationship '{relationship_name}' (in column '{path}')")
+            if relationship.uselist:
+                raise ValueError(
+                    f"Column '{path}' goes through the collection '{relationship_name}'; only many-to-one relationships are supported")
+
+            key = tuple(relationship_names[:i + 1])
+            if key not in aliases:
+                alias = aliased(relationship.mapper.class_)
+                from_clause = outerjoin(from_clause, alias, getattr(
+                    parent_entity, relationship_name).of_type(alias))
+                aliases[key] = alias
+                attribute = getattr(parent, relationship_name)
+                load_options[key] = joinedload(attribute) if i == 0 else load_options[key[:-1]].joinedload(attribute)
+            parent, parent_entity = relationship.mapper.class_, aliases[key]
+
+        if column_name not in parent.__table__.columns:
+            raise ValueError(
+                f"{parent.__name__} has no column '{column_name}' (in column '{path}')")
+        columns[path] = getattr(parent_entity, column_name).label(path)
+
+    return from_clause, columns, list(load_options.values())
+
+
 def register_admin_model_view(
     model: type,
-    columns: List[Column],
+    columns: List[_COLUMN_T],
     column_names: Optional[List[str]] = None,
     name: Optional[str] = None,
     name_plural: Optional[str] = None,
     formatters: Optional[Dict[Column, Callable[[Any], str]]] = None,
-    sort_by_keys: Optional[List[_SORT_BY_KEY_T]] = None
+    sort_by_keys: Optional[List[_SORT_BY_KEY_T]] = None,
+    pagination_mode: AdminListPaginationMode = AdminListPaginationMode.OFFSET,
+    count_strategy: AdminListCountStrategy = AdminListCountStrategy.EXACT,
+    count_cache_ttl: float = 60.0,
+    fetch_strategy: AdminListFetchStrategy = AdminListFetchStrategy.SEQUENTIAL,
+    search_columns: Optional[List[Column]] = None,
+    indexed_columns: Optional[List[Column]] = None,
+    unindexed_sort_policy: AdminListUnindexedSortPolicy = AdminListUnindexedSortPolicy.WARN,
 ) -> None:
 
+    relationship_paths = [column for column in columns if isinstance(column, str)]
+    if relationship_paths:
+        select_from, relationship_columns, load_options = _resolve_relationship_columns(
+            model, relationship_paths)
+        columns = [relationship_columns.get(column, column) if isinstance(column, str) else column
+                   for column in columns]
+    else:
+        select_from, relationship_columns, load_options = None, {}, []
+
     if column_names is None:
         column_names = [column.name for column in columns]
 
@@ -81,15 +230,21 @@ def register_admin_model_view(
 
     if formatters is None:
         formatters = {}
+    # Formatters of relationship columns are keyed by their path.
+    formatters = {relationship_columns.get(column, column) if isinstance(column, str) else column: formatter
+                  for column, formatter in formatters.items()}
 
     _models[identity] = model
-    _forms[identity] = make_form(model)
-    _primary_key_forms[identity] = make_primary_key_form(model)
     _names[identity] = name
     _names_plural[identity] = name_plural
     _column_names[identity] = column_names
     _columns[identity] = columns
     _formatters[identity] = defaultdict(lambda: _default_formatter, formatters)
+    _row_projectors[identity] = RowProjector(columns, _formatters[identity])
+    _object_projectors[identity] = ObjectProjector(
+        model, formatters, _default_formatter, relationship_paths)
+    _select_froms[identity] = select_from
+    _load_options[identity] = load_options
     _primary_key_columns[identity] = [
         column for column in columns if column.primary_key]
     _primary_key_names[identity] = [
@@ -100,15 +255,56 @@ def register_admin_model_view(
     else:
         _sort_by_keys_dict[identity] = _primary_key_columns[identity]
 
+    _pagination_modes[identity] = pagination_mode
+    _keyset_keys[identity] = _make_keyset_keys(
+        model, _sort_by_keys_dict[identity])
+    _count_strategies[identity] = count_strategy
+    _count_cache_ttls[identity] = count_cache_ttl
+    _fetch_strategies[identity] = fetch_strategy
+
+    if search_columns is None:
+        # Relationship columns are display only; the count query does not join them.
+        search_columns = [column for column in columns
+                          if not isinstance(column, Label) and _is_string_type(column.type)]
+    _search_columns[identity] = search_columns
+
+    # Indexes managed outside of the model metadata can be declared explicitly.
+    _indexed_column_names[identity] = _get_indexed_column_names(model.__table__) | {
+        column.name for column in indexed_columns or []}
+    _unindexed_sort_policies[identity] = unindexed_sort_policy
+
 
 def get_form_class(identity: str) -> Form:
-    return _forms[identity]
+    # Form classes reflect every column of the model, so they are built on
+    # first use rather than at registration, which runs at import time.
+    form_cls = _forms.get(identity)
+    if form_cls is None:
+        form_cls = _forms[identity] = make_form(_models[identity])
+    return form_cls
+
+
+def get_primary_key_form_class(identity: str) -> Form:
+    form_cls = _primary_key_forms.get(identity)
+    if form_cls is None:
+        form_cls = _primary_key_forms[identity] = make_primary_key_form(
+            _models[identity])
+    return form_cls
 
 
 def get_model(identity: str) -> DeclarativeBase:
     return _models.get(identity)
 
 
+def get_identity(model: type) -> Optional[str]:
+    """
+    Identity `model` is registered under, or None if it has no admin view.
+    """
+    for identity, registered in _models.items():
+        if registered is model:
+            return identity
+    return None
+
+
 def get_name_plural(identity: str) -> str:
     return _names_plural.get(identity)
 
@@ -133,6 +329,14 @@ def get_formatters(identity: str) -> Dict[Column, Callable[[Any], str]]:
     return _formatters.get(identity)
 
 
+def get_row_projector(identity: str) -> RowProjector:
+    return _row_projectors.get(identity)
+
+
+def get_object_projector(identity: str) -> ObjectProjector:
+    return _object_projectors.get(identity)
+
+
 def get_primary_key_columns(identity: str) -> List[Column]:
     return _primary_key_columns.get(identity)
 
@@ -142,7 +346,7 @@ def get_primary_key_names(identity: str) -> List[str]:
 
 
 def get_validated_primary_entries(identity: str, request: Request) -> Dict[str, Any]:
-    form_cls = _primary_key_forms[identity]
+    form_cls = get_primary_key_form_class(identity)
     form = form_cls(request.query_params)
     if form.validate():
         return form.data
@@ -155,6 +359,59 @@ def get_sort_by_keys(identity: str) -> List[_SORT_BY_KEY_T]:
     return _sort_by_keys_dict.get(identity)
 
 
+def get_pagination_mode(identity: str) -> AdminListPaginationMode:
+    return _pagination_modes.get(identity)
+
+
+def get_keyset_keys(identity: str, sort_by_keys: Optional[List[_SORT_BY_KEY_T]] = None) -> List[Tuple[Column, AdminListSortOrder]]:
+    if sort_by_keys is not None:
+        return _make_keyset_keys(_models[identity], sort_by_keys)
+    return _keyset_keys.get(identity)
+
+
+def get_count_strategy(identity: str) -> AdminListCountStrategy:
+    return _count_strategies.get(identity)
+
+
+def get_count_cache_ttl(identity: str) -> float:
+    return _count_cache_ttls.get(identity)
+
+
+def get_select_from(identity: str) -> Optional[Any]:
+    """
+    Join of the model with the relationships of its relationship columns, or
+    None if it has none.
+    """
+    return _select_froms.get(identity)
+
+
+def get_load_options(identity: str) -> List[Load]:
+    return _load_options.get(identity)
+
+
+def get_fetch_strategy(identity: str) -> AdminListFetchStrategy:
+    return _fetch_strategies.get(identity)
+
+
+def get_search_columns(identity: str) -> List[Column]:
+    return _search_columns.get(identity)
+
+
+def get_sortable_column(identity: str, name: str) -> Optional[Column]:
+    for column in _columns[identity]:
+        if column.name == name:
+            return column
+    return None
+
+
+def is_column_indexed(identity: str, name: str) -> bool:
+    return name in _indexed_column_names[identity]
+
+
+def get_unindexed_sort_policy(identity: str) -> AdminListUnindexedSortPolicy:
+    return _unindexed_sort_policies.get(identity)
+
+
 def identity_exists(identity: str) -> bool:
     if identity not in _models:
         raise HTTPException(
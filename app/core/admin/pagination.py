@@ -0,0 +1,113 @@
+import base64
+import binascii
+import datetime
+import decimal
+import enum
+import json
+
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import Column, and_, or_, tuple_
+from sqlalchemy.sql import asc, desc
+from sqlalchemy.sql.elements import ColumnElement
+
+from .internal import AdminListSortOrder
+
+
+_KEYSET_KEY_T = Tuple[Column, AdminListSortOrder]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(column: Column, value: Any) -> Any:
+    if value is None:
+        return None
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if issubclass(python_type, enum.Enum):
+        return python_type[value]
+    if issubclass(python_type, (datetime.date, datetime.time)):
+        return python_type.fromisoformat(value)
+    if isinstance(value, python_type):
+        return value
+    return python_type(value)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key values of a row into an opaque, URL-safe cursor.
+    """
+    data = json.dumps([_encode_value(value) for value in values],
+                      separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Column]) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor` back into typed values.
+
+    Raises ValueError if the cursor is malformed or does not match the columns.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Malformed cursor: {e}")
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Cursor does not match the sort keys")
+
+    try:
+        return [_decode_value(column, value) for column, value in zip(columns, values)]
+    except (KeyError, TypeError, ValueError, decimal.InvalidOperation) as e:
+        raise ValueError(f"Invalid cursor value: {e}")
+
+
+def _is_forward(order: AdminListSortOrder, backwards: bool) -> bool:
+    return (order == AdminListSortOrder.ASCENDING) != backwards
+
+
+def keyset_order_by(keys: Sequence[_KEYSET_KEY_T], backwards: bool = False) -> List[ColumnElement]:
+    """
+    ORDER BY clauses for the keyset keys, reversed when paging backwards.
+    """
+    return [asc(column) if _is_forward(order, backwards) else desc(column)
+            for column, order in keys]
+
+
+def keyset_predicate(keys: Sequence[_KEYSET_KEY_T], values: Sequence[Any], backwards: bool = False) -> ColumnElement:
+    """
+    WHERE clause selecting the rows strictly after (or before, when paging
+    backwards) the row whose sort key values are `values`.
+    """
+    columns = [column for column, _ in keys]
+    orders = {order for _, order in keys}
+
+    if len(orders) == 1:
+        # A row value comparison can be served directly by a composite index.
+        if _is_forward(orders.pop(), backwards):
+            return tuple_(*columns) > tuple_(*values)
+        return tuple_(*columns) < tuple_(*values)
+
+    # Mixed directions: (k1 > v1) OR (k1 = v1 AND k2 < v2) OR ...
+    clauses = []
+    for i, (column, order) in enumerate(keys):
+        equalities = [columns[j] == values[j] for j in range(i)]
+        if _is_forward(order, backwards):
+            comparison = column > values[i]
+        else:
+            comparison = column < values[i]
+        clauses.append(and_(*equalities, comparison))
+    return or_(*clauses)
@@ -0,0 +1,58 @@
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Sequence
+
+from sqlalchemy import Column
+from sqlalchemy.orm import DeclarativeBase
+
+
+class AdminRow(NamedTuple):
+    primary_entries: Dict[str, Any]
+    display_values: List[Any]
+
+
+class RowProjector:
+    """
+    Turns rows selected with `select(*columns)` into template rows. Formatters
+    and primary key positions are resolved once at registration, so projecting
+    a row is plain positional access.
+    """
+
+    def __init__(self, columns: List[Column], formatters: Mapping[Column, Callable[[Any], str]]):
+        self.formatters = [formatters[column] for column in columns]
+        self.primary_keys = [(column.name, index)
+                             for index, column in enumerate(columns) if column.primary_key]
+
+    def __call__(self, rows: Sequence[Sequence[Any]]) -> List[AdminRow]:
+        formatters = self.formatters
+        primary_keys = self.primary_keys
+        # zip() stops at the registered columns; keyset queries may select extra sort keys after them.
+        return [AdminRow({name: row[index] for name, index in primary_keys},
+                         [formatter(value) for formatter, value in zip(formatters, row)])
+                for row in rows]
+
+
+def _get_path(obj: Any, path: Sequence[str]) -> Any:
+    for name in path:
+        if obj is None:
+            return None
+        obj = getattr(obj, name)
+    return obj
+
+
+class ObjectProjector:
+    """
+    Display values of every table column of a model instance, followed by its
+    relationship columns, with formatters resolved by column name once at
+    registration. Relationship columns read attributes of related instances,
+    which must have been loaded with the identity's load options.
+    """
+
+    def __init__(self, model: DeclarativeBase, formatters: Mapping[Column, Callable[[Any], str]], default_formatter: Callable[[Any], str], relationship_paths: Sequence[str] = ()):
+        by_name = {column.name: formatter for column,
+                   formatter in formatters.items()}
+        self.fields = [(column.name, (column.name,), by_name.get(column.name, default_formatter))
+                       for column in model.__table__.columns]
+        self.fields.extend((path, tuple(path.split(".")), by_name.get(path, default_formatter))
+                           for path in relationship_paths)
+
+    def __call__(self, obj: DeclarativeBase) -> Dict[str, Any]:
+        return {name: formatter(_get_path(obj, path)) for name, path, formatter in self.fields}
@@ -0,0 +1,22 @@
+from typing import Dict
+
+from .counts import invalidate_count
+
+
+# Set by the admin API on the client that made a change.
+ADMIN_WRITE_STAMP_COOKIE = "admin_write_stamp"
+
+# Per-identity counters bumped whenever the admin API or the CRUD layer
+# changes rows. They key cached renders and list ETags. Counters are per
+# process: user changes reach other workers through the user change listener,
+# other models only when their cache entries expire.
+_model_versions: Dict[str, int] = {}
+
+
+def get_model_version(identity: str) -> int:
+    return _model_versions.get(identity, 0)
+
+
+def mark_model_changed(identity: str) -> None:
+    _model_versions[identity] = _model_versions.get(identity, 0) + 1
+    invalidate_count(identity)
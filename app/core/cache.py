@@ -0,0 +1,87 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    In-process mapping bounded to `maxsize` entries (least recently used are
+    evicted first) whose entries expire `ttl` seconds after being set. While
+    `enabled` is False every lookup misses and nothing is stored.
+
+    `generation` is bumped whenever entries are invalidated, so a caller can
+    tell whether a value it loaded may have gone stale before storing it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if not self.enabled or self.maxsize <= 0:
+            return
+        if ttl is None:
+            ttl = self.ttl
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self.generation += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "enabled": int(self.enabled),
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+# Authenticated users keyed by token subject (the username). Enabled only
+# while the worker listens for user change notifications (see
+# app.database.user_changes), so other processes' writes are never missed.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE,
+                      ttl=settings.USER_CACHE_TTL_SECONDS, enabled=False)
+
+
+def invalidate_cached_user(username: Optional[str] = None) -> None:
+    """
+    Drop the cached user `username`, or every cached user if it is None.
+    """
+    if username is None:
+        user_cache.clear()
+    else:
+        user_cache.pop(username)
@@ -1,11 +1,21 @@
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import hashlib
+import time
 import bcrypt
 import jwt
 from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core import metrics
+from app import schemas
 
 ALGORITHM = "HS256"
 
+# Verified token payloads keyed by token digest, each kept until the token expires.
+_token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=0)
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     expire = datetime.now(timezone.utc) + expires_delta
@@ -15,6 +25,25 @@ def create_access_token(subject: str | Any, expires_delta: timedelta) -> str:
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> schemas.TokenPayload:
+    """
+    Verify `token` and return its payload. Raises jwt.InvalidTokenError or
+    pydantic.ValidationError if the token is invalid.
+    """
+    digest = hashlib.sha256(token.encode('utf-8')).digest()
+    token_data = _token_cache.get(digest)
+    if token_data is not None:
+        return token_data
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    token_data = schemas.TokenPayload(**payload)
+
+    exp = payload.get("exp")
+    if exp is not None:
+        _token_cache.set(digest, token_data, ttl=exp - time.time())
+    return token_data
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
@@ -22,3 +51,75 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
     return hashed.decode('utf-8')
+
+
+# bcrypt is deliberately slow, so the async variants below run it on a bounded
+# executor instead of blocking the event loop.
+_password_executor: Optional[Executor] = None
+_password_semaphore: Optional[asyncio.Semaphore] = None
+_password_queue_depth = 0
+_password_in_flight = 0
+
+PASSWORD_HASH_DURATION = metrics.Histogram(
+    "password_hash_duration_seconds", "bcrypt time per operation, including executor queueing.", ("operation",))
+
+
+def _get_password_executor() -> Executor:
+    global _password_executor
+    if _password_executor is None:
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _password_executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_MAX_WORKERS)
+        else:
+            _password_executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_MAX_WORKERS, thread_name_prefix="password-hash")
+    return _password_executor
+
+
+async def _run_password_task(func: Callable[..., Any], *args: Any) -> Any:
+    global _password_semaphore, _password_queue_depth, _password_in_flight
+    if _password_semaphore is None:
+        _password_semaphore = asyncio.Semaphore(
+            settings.PASSWORD_HASH_MAX_CONCURRENCY)
+
+    _password_queue_depth += 1
+    try:
+        await _password_semaphore.acquire()
+    finally:
+        _password_queue_depth -= 1
+
+    _password_in_flight += 1
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_password_executor(), func, *args)
+    finally:
+        _password_in_flight -= 1
+        _password_semaphore.release()
+        if settings.METRICS_ENABLED:
+            PASSWORD_HASH_DURATION.observe(
+                time.perf_counter() - start, func.__name__)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_password_task(get_password_hash, password)
+
+
+def get_password_pool_stats() -> Dict[str, int]:
+    return {
+        "queue_depth": _password_queue_depth,
+        "in_flight": _password_in_flight,
+        "max_concurrency": settings.PASSWORD_HASH_MAX_CONCURRENCY,
+        "max_workers": settings.PASSWORD_HASH_MAX_WORKERS,
+    }
+
+
+def shutdown_password_executor() -> None:
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
@@ -0,0 +1,40 @@
+import logging
+import time
+
+from typing import List, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """
+    Wall-clock time of the steps between the first import of the application
+    and the end of its lifespan startup. Each mark records the time elapsed
+    since the previous one.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self._last = self.started_at
+        self.steps: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.steps.append((name, now - self._last))
+        self._last = now
+
+    def report(self) -> str:
+        width = max((len(name) for name, _ in self.steps), default=0)
+        lines = [f"{name.ljust(width)}  {seconds * 1000:9.1f} ms"
+                 for name, seconds in self.steps]
+        lines.append(
+            f"{'total'.ljust(width)}  {(self._last - self.started_at) * 1000:9.1f} ms")
+        return "\n".join(lines)
+
+    def log_report(self) -> None:
+        logger.info(f"Startup profile:\n{self.report()}")
+
+
+# Created when app.main first imports this module.
+startup_profile = StartupProfile()
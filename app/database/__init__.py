@@ -1,8 +1,45 @@
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
 from .base import Base
 from .models import *  # Import all models to register them with Base
 from .session import engine
 
 
+ALEMBIC_CONFIG_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+def get_head_revision() -> str:
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config(str(ALEMBIC_CONFIG_PATH))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+async def verify_schema_version():
+    """
+    Check with a single query that the database is at the latest migration.
+    Raises RuntimeError otherwise, so that a worker does not serve requests
+    against a schema it does not match.
+    """
+    head = get_head_revision()
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:
+            raise RuntimeError(
+                "The database is not under migration. Run `alembic upgrade head`, or "
+                "`alembic stamp 0001` first if its tables were created by create_all.")
+        current = result.scalar()
+
+    if current != head:
+        raise RuntimeError(
+            f"The database schema is at revision {current}, expected {head}. Run `alembic upgrade head`.")
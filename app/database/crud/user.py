@@ -1,21 +1,85 @@
 from ..models.user import User, UserType
 
+from collections import Counter
+from typing import List, Sequence, Tuple
+
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import select, update, or_
+
+from app import schemas
+
+
+# PostgreSQL's wire protocol allows at most 32767 bind parameters per statement.
+_CREATE_USERS_CHUNK_SIZE = 32767 // len(schemas.UserCreate.model_fields)
+
+
+class UserAlreadyExistsError(ValueError):
+    def __init__(self, fields: List[str]):
+        self.fields = fields
+        super().__init__(
+            f"User with this {' and '.join(fields) or 'username or email'} already exists")
+
+
+async def _get_conflicting_fields(db: AsyncSession, username: str, email: str) -> List[str]:
+    stmt = select(User.username, User.email).where(
+        or_(User.username == username, User.email == email))
+    result = await db.execute(stmt)
+    fields = set()
+    for row in result.all():
+        if row.username == username:
+            fields.add("username")
+        # EmailType stores addresses lowercased.
+        if row.email == email.lower():
+            fields.add("email")
+    return [field for field in ("username", "email") if field in fields]
 
 
 async def create_user(db: AsyncSession, username: str, full_name: str, hashed_password: str, email: str, user_type: UserType = UserType.COMMON):
-    try:
-        db_user = User(username=username, full_name=full_name, hashed_password=hashed_password,
-                       email=email, user_type=user_type)
-        db.add(db_user)
-        await db.commit()
-        await db.refresh(db_user)
-        return db_user
-    except IntegrityError:
+    """
+    Insert a user and return it in one round trip.
+
+    Raises UserAlreadyExistsError naming the conflicting unique columns if
+    the username or email is taken.
+    """
+    stmt = insert(User).values(username=username, full_name=full_name, hashed_password=hashed_password,
+                               email=email, user_type=user_type).on_conflict_do_nothing().returning(User)
+    db_user = (await db.scalars(stmt)).one_or_none()
+
+    if db_user is None:
+        fields = await _get_conflicting_fields(db, username, email)
         await db.rollback()
-        return None
+        raise UserAlreadyExistsError(fields)
+
+    await db.commit()
+    return db_user
+
+
+async def create_users(db: AsyncSession, users: Sequence[schemas.UserCreate]) -> Tuple[List[User], List[schemas.UserCreate]]:
+    """
+    Insert users with multi-row INSERT ... ON CONFLICT DO NOTHING statements.
+    Returns the created users and the input users that were skipped because
+    their username or email was already taken.
+    """
+    created = []
+    for i in range(0, len(users), _CREATE_USERS_CHUNK_SIZE):
+        chunk = users[i:i + _CREATE_USERS_CHUNK_SIZE]
+        stmt = insert(User).values([user.model_dump() for user in chunk]
+                                   ).on_conflict_do_nothing().returning(User)
+        created.extend((await db.scalars(stmt)).all())
+    await db.commit()
+
+    # EmailType stores addresses lowercased.
+    created_keys = Counter((user.username, user.email.lower())
+                           for user in created)
+    skipped = []
+    for user in users:
+        key = (user.username, user.email.lower())
+        if created_keys[key]:
+            created_keys[key] -= 1
+        else:
+            skipped.append(user)
+    return created, skipped
 
 
 async def get_users(db: AsyncSession, skip: int = 0, limit: int = 10):
@@ -40,3 +104,17 @@ async def get_user_by_id(db: AsyncSession, user_id: int):
     stmt = select(User).filter(User.id == user_id)
     result = await db.execute(stmt)
     return result.scalars().first()
+
+
+async def update_user_type(db: AsyncSession, username: str, user_type: UserType) -> bool:
+    """
+    Change the type of user `username`. Returns False if there is no such
+    user.
+    """
+    stmt = update(User).where(User.username == username).values(
+        user_type=user_type).returning(User.id)
+    if (await db.execute(stmt)).first() is None:
+        await db.rollback()
+        return False
+    await db.commit()
+    return True
@@ -1,14 +1,18 @@
 from ..base import Base
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 
 
 class Address(Base):
     __tablename__ = 'addresses'
+    __table_args__ = (
+        Index('ix_addresses_email_address_trgm', 'email_address', postgresql_using='gin',
+              postgresql_ops={'email_address': 'gin_trgm_ops'}),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     email_address: Mapped[str]
-    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'), index=True)
     user: Mapped['User'] = relationship(  # type: ignore
         back_populates='addresses')
 
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Unicode
+from sqlalchemy import DDL, Index, String, Unicode, event
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 from sqlalchemy_utils.types.email import EmailType
 
@@ -11,6 +11,13 @@ from app.enums import UserType
 
 class User(Base):
     __tablename__ = 'users'
+    __table_args__ = (
+        # Serve the admin's case-insensitive substring search.
+        Index('ix_users_username_trgm', 'username', postgresql_using='gin',
+              postgresql_ops={'username': 'gin_trgm_ops'}),
+        Index('ix_users_email_trgm', 'email', postgresql_using='gin',
+              postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(String(30), unique=True)
     full_name: Mapped[str] = mapped_column(Unicode(255))
@@ -23,3 +30,24 @@ class User(Base):
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, email={self.email}, user_type={self.user_type})>"
+
+
+# Every insert, update and delete on users is announced on this channel, with
+# the username as payload, when its transaction commits. Workers listen on it
+# to drop cached users (app.database.user_changes). Migration 0003 installs the
+# same trigger on migrated databases.
+USER_CHANGED_CHANNEL = "user_changed"
+
+event.listen(User.__table__, "after_create", DDL(f"""
+CREATE OR REPLACE FUNCTION notify_user_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{USER_CHANGED_CHANNEL}',
+                      CASE WHEN TG_OP = 'INSERT' THEN NEW.username ELSE OLD.username END);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""").execute_if(dialect="postgresql"))
+event.listen(User.__table__, "after_create", DDL("""
+CREATE TRIGGER users_notify_changed AFTER INSERT OR UPDATE OR DELETE ON users
+FOR EACH ROW EXECUTE FUNCTION notify_user_changed()
+""").execute_if(dialect="postgresql"))
@@ -0,0 +1,216 @@
+import logging
+import re
+import time
+
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.database.session import engine, replica_engine
+
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape: literals and bind parameters become `?`,
+    parameter lists collapse to `(...)` and whitespace is folded, so the same
+    query issued for different rows normalizes to the same string.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class RequestQueryLog:
+    """
+    Statements issued while serving one request, grouped by their SQL text.
+    """
+    __slots__ = ("scope", "statements", "total_queries", "total_seconds")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        # sql -> [count, total seconds]
+        self.statements: Dict[str, List[float]] = {}
+        self.total_queries = 0
+        self.total_seconds = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}"
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.total_queries += 1
+        self.total_seconds += elapsed
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def repeated_statements(self, threshold: int) -> List[Dict[str, Any]]:
+        if self.total_queries < threshold:
+            return []
+        # Normalized once per distinct statement, at the end of the request.
+        normalized: Dict[str, List[float]] = {}
+        for statement, (count, seconds) in self.statements.items():
+            entry = normalized.setdefault(normalize_sql(statement), [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+        return [{"statement": statement, "count": int(count), "total_ms": round(seconds * 1000, 3)}
+                for statement, (count, seconds) in normalized.items() if count >= threshold]
+
+
+# Statement observers are called after every statement with the engine name,
+# the SQL, its duration in seconds and the current request log (None outside
+# a request); request observers with the request log once the request ends.
+StatementObserver = Callable[[str, str, float, Optional[RequestQueryLog]], None]
+RequestObserver = Callable[[RequestQueryLog], None]
+
+_statement_observers: List[StatementObserver] = []
+_request_observers: List[RequestObserver] = []
+
+_request_query_log: ContextVar[Optional[RequestQueryLog]] = ContextVar(
+    "request_query_log", default=None)
+
+slow_queries: Deque[Dict[str, Any]] = deque(
+    maxlen=settings.DB_QUERY_LOG_HISTORY)
+n_plus_one_requests: Deque[Dict[str, Any]] = deque(
+    maxlen=settings.DB_QUERY_LOG_HISTORY)
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    _statement_observers.append(observer)
+
+
+def add_request_observer(observer: RequestObserver) -> None:
+    _request_observers.append(observer)
+
+
+def attach_query_log(sync_engine: Engine, engine_name: str) -> None:
+    """
+    Time every statement on `sync_engine`, add it to the log of the current
+    request and pass it to the statement observers.
+    """
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_log_start_time", []).append(
+            time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - \
+            conn.info["query_log_start_time"].pop()
+        request_log = _request_query_log.get()
+        if request_log is not None:
+            request_log.record(statement, elapsed)
+        for observer in _statement_observers:
+            observer(engine_name, statement, elapsed, request_log)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_log_start_time"):
+            connection.info["query_log_start_time"].pop()
+
+
+def _log_slow_query(engine_name: str, statement: str, elapsed: float, request_log: Optional[RequestQueryLog]) -> None:
+    if elapsed < settings.DB_SLOW_QUERY_THRESHOLD_MS / 1000:
+        return
+    normalized = normalize_sql(statement)
+    route = request_log.route if request_log is not None else None
+    logger.warning(
+        f"Slow query ({elapsed * 1000:.1f} ms) from {route or 'outside a request'}: {normalized}")
+    slow_queries.append({
+        "route": route,
+        "statement": normalized,
+        "duration_ms": round(elapsed * 1000, 3),
+        "timestamp": time.time(),
+    })
+
+
+def _log_n_plus_one(request_log: RequestQueryLog) -> None:
+    # The same normalized statement issued DB_N_PLUS_ONE_THRESHOLD times or
+    # more is what a lazy load per row looks like.
+    repeated = request_log.repeated_statements(
+        settings.DB_N_PLUS_ONE_THRESHOLD)
+    if repeated:
+        logger.warning(
+            f"Possible N+1 in {request_log.route}: {', '.join(str(entry['count']) + 'x ' + entry['statement'] for entry in repeated)}")
+        n_plus_one_requests.append({
+            "route": request_log.route,
+            "path": request_log.scope.get("path"),
+            "total_queries": request_log.total_queries,
+            "repeated": repeated,
+            "timestamp": time.time(),
+        })
+
+
+class QueryLogMiddleware:
+    """
+    Collects the statements of each HTTP request and hands the log to the
+    request observers once the response is sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_log = RequestQueryLog(scope)
+        token = _request_query_log.set(request_log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_query_log.reset(token)
+            for observer in _request_observers:
+                observer(request_log)
+
+
+def install_query_log(app: FastAPI) -> None:
+    """
+    Collect the statements of every request on the primary and replica
+    engines, once per app however often it is called; the metrics and the
+    slow query / N+1 log (DB_QUERY_LOG_ENABLED) share this one collector.
+    """
+    if getattr(app.state, "query_log_installed", False):
+        return
+    app.state.query_log_installed = True
+
+    attach_query_log(engine.sync_engine, "primary")
+    if replica_engine is not None:
+        attach_query_log(replica_engine.sync_engine, "replica")
+    if settings.DB_QUERY_LOG_ENABLED:
+        add_statement_observer(_log_slow_query)
+        add_request_observer(_log_n_plus_one)
+    app.add_middleware(QueryLogMiddleware)
+
+
+def get_query_log_report() -> Dict[str, Any]:
+    return {
+        "slow_query_threshold_ms": settings.DB_SLOW_QUERY_THRESHOLD_MS,
+        "n_plus_one_threshold": settings.DB_N_PLUS_ONE_THRESHOLD,
+        "slow_queries": list(slow_queries),
+        "n_plus_one_requests": list(n_plus_one_requests),
+    }
@@ -1,16 +1,118 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import time
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from app.core.config import settings
 
 
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long checkouts wait for a connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait_stats: Dict[str, float] = {
+            "count": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+        }
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.checkout_wait_stats
+            stats["count"] += 1
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+
+def _get_engine_kwargs() -> Dict[str, Any]:
+    connect_args: Dict[str, Any] = {
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_STATEMENT_TIMEOUT_MS is not None:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+    kwargs: Dict[str, Any] = {
+        "connect_args": connect_args,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    if settings.DB_USE_NULL_POOL:
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return kwargs
+
+
 # Create asynchronous engine
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
+    **_get_engine_kwargs(),
 )
 
+# Optional read-only engine for side-effect-free queries
+replica_engine: Optional[AsyncEngine] = None
+if settings.POSTGRES_REPLICA_DSN:
+    replica_engine = create_async_engine(
+        settings.POSTGRES_REPLICA_DSN,
+        **_get_engine_kwargs(),
+    )
+
 # Create session factory
 AsyncSessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False
 )
+
+AsyncReadSessionLocal: Optional[sessionmaker] = None
+if replica_engine is not None:
+    AsyncReadSessionLocal = sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+
+def get_session_factory(db: AsyncSession) -> sessionmaker:
+    """
+    The factory `db` was opened from, so a sibling session (e.g. for a query
+    on a second connection) gets the same engine and options.
+    """
+    if AsyncReadSessionLocal is not None and db.bind is replica_engine:
+        return AsyncReadSessionLocal
+    return AsyncSessionLocal
+
+
+def get_pool_stats(async_engine: AsyncEngine = engine) -> Dict[str, Any]:
+    pool = async_engine.sync_engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            in_use=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(
+            checkout_waits=pool.checkout_wait_stats["count"],
+            checkout_wait_seconds_total=pool.checkout_wait_stats["total_seconds"],
+            checkout_wait_seconds_max=pool.checkout_wait_stats["max_seconds"],
+        )
+    return stats
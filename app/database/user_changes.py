@@ -0,0 +1,86 @@
+import asyncio
+import logging
+
+from typing import Optional
+
+import asyncpg
+
+from app.core.admin.internal import get_identity
+from app.core.admin.versions import mark_model_changed
+from app.core.cache import user_cache, invalidate_cached_user
+from app.database.models import User
+from app.database.models.user import USER_CHANGED_CHANNEL
+from app.database.session import engine
+
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_DELAY_SECONDS = 5.0
+
+
+class UserChangeListener:
+    """
+    Keeps a dedicated connection LISTENing on USER_CHANGED_CHANNEL, which a
+    trigger on users notifies, and drops cached users and admin user pages as
+    notifications arrive, whichever process made the change.
+
+    The user cache is enabled only while the connection is up: notifications
+    sent while it is down are lost, so the cache is cleared and bypassed until
+    the listener has reconnected.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        invalidate_cached_user(payload or None)
+        # Admin user pages rendered by this worker are stale as well.
+        identity = get_identity(User)
+        if identity is not None:
+            mark_model_changed(identity)
+
+    def _set_listening(self, listening: bool) -> None:
+        user_cache.clear()
+        user_cache.enabled = listening
+
+    async def _run(self) -> None:
+        dsn = engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False)
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(USER_CHANGED_CHANNEL, self._on_notification)
+                self._set_listening(True)
+                await closed.wait()
+                logger.warning(
+                    "User change listener disconnected; user cache disabled until it reconnects")
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"User change listener failed to connect: {e}")
+            except Exception:
+                # Keep retrying: a dead task would leave the cache disabled
+                # for the life of the worker.
+                logger.exception("User change listener failed")
+            finally:
+                self._set_listening(False)
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+user_change_listener = UserChangeListener()
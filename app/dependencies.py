@@ -1,27 +1,51 @@
 from typing import Annotated, Optional, Dict
 
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request, Response
 from fastapi.responses import RedirectResponse
 from fastapi.security import OAuth2
 from fastapi.openapi.models import OAuthFlows as OAuthFlowsModel
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-import jwt
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 
 
-from app.database.session import AsyncSessionLocal
-from app.database import crud
+from app.database.session import AsyncSessionLocal, AsyncReadSessionLocal
 from app.core.config import settings
+from app.database import crud
 from app import schemas
 from app.core import security
+from app.core.cache import user_cache
 from app.enums import UserType
 
 
-async def get_db():
-    async with AsyncSessionLocal() as db:
+# Set on clients that just committed a write so that their reads skip the replica.
+READ_YOUR_WRITES_COOKIE = "db_read_primary"
+
+
+def _set_read_your_writes_cookie(session: Session) -> None:
+    response = session.info.get("response")
+    if response is not None:
+        response.set_cookie(READ_YOUR_WRITES_COOKIE, "1",
+                            max_age=settings.DB_READ_YOUR_WRITES_SECONDS, httponly=True)
+
+
+if AsyncReadSessionLocal is not None:
+    # One listener for all sessions instead of one registered per request.
+    event.listen(Session, "after_commit", _set_read_your_writes_cookie)
+
+
+async def get_db(response: Response):
+    """
+    Primary session of the request. FastAPI resolves this once per request, so
+    the auth dependencies and the handler share it. The session only checks
+    out a pooled connection when it runs its first statement, so requests that
+    never query (anonymous pages, cached users) do not touch the pool.
+    """
+    async with AsyncSessionLocal(info={"response": response}) as db:
         try:
             yield db
         finally:
@@ -30,6 +54,25 @@ async def get_db():
 DBDependency = Annotated[AsyncSession, Depends(get_db)]
 
 
+async def get_read_db(request: Request, db: DBDependency):
+    """
+    Session for side-effect-free reads. Uses the replica when one is configured,
+    unless the client committed a write within DB_READ_YOUR_WRITES_SECONDS, and
+    otherwise shares the request's primary session.
+    """
+    if AsyncReadSessionLocal is None or READ_YOUR_WRITES_COOKIE in request.cookies:
+        yield db
+        return
+
+    async with AsyncReadSessionLocal() as read_db:
+        try:
+            yield read_db
+        finally:
+            await read_db.close()
+
+ReadDBDependency = Annotated[AsyncSession, Depends(get_read_db)]
+
+
 class OAuth2PasswordBearerWithCookie(OAuth2):
     def __init__(
         self,
@@ -83,18 +126,33 @@ TokenDependencyOptional = Annotated[Optional[str], Depends(
     reusable_oauth2_optional)]
 
 
-async def get_current_user(db: DBDependency, token: TokenDependency) -> schemas.User:
+async def get_user_by_token_subject(db: AsyncSession, username: str) -> Optional[schemas.User]:
+    user = user_cache.get(username)
+    if user is not None:
+        return user
+
+    generation = user_cache.generation
+    db_user = await crud.get_user_by_username(db, username)
+    if db_user is None:
+        return None
+
+    user = schemas.User.model_validate(db_user, from_attributes=True)
+    # A change notified while the row was being read may not be reflected in
+    # it; caching it would outlive the invalidation.
+    if user_cache.generation == generation:
+        user_cache.set(username, user)
+    return user
+
+
+async def get_current_user(db: ReadDBDependency, token: TokenDependency) -> schemas.User:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = schemas.TokenPayload(**payload)
+        token_data = security.decode_access_token(token)
     except (InvalidTokenError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = await crud.get_user_by_username(db, token_data.sub)
+    user = await get_user_by_token_subject(db, token_data.sub)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -121,20 +179,17 @@ CurrentAdminUser = Annotated[schemas.User, Depends(get_current_admin_user)]
 async def get_current_user_for_page(
         request: Request,
         token: TokenDependencyOptional,
-        db: DBDependency
+        db: ReadDBDependency
 ) -> Optional[schemas.User]:
     if not token:
         return None
 
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = schemas.TokenPayload(**payload)
+        token_data = security.decode_access_token(token)
     except (InvalidTokenError, ValidationError):
         return None
 
-    user = await crud.get_user_by_username(db, token_data.sub)
+    user = await get_user_by_token_subject(db, token_data.sub)
     if not user:
         return None
 
@@ -147,7 +202,7 @@ CurrentUserForPage = Annotated[Optional[schemas.User], Depends(
 async def get_current_admin_user_for_page(
     request: Request,
     token: TokenDependencyOptional,
-    db: DBDependency
+    db: ReadDBDependency
 ) -> schemas.User:
     if not token:
         raise HTTPException(
@@ -158,10 +213,7 @@ async def get_current_admin_user_for_page(
         )
 
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        token_data = schemas.TokenPayload(**payload)
+        token_data = security.decode_access_token(token)
     except (InvalidTokenError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_303_SEE_OTHER,
@@ -170,7 +222,7 @@ async def get_current_admin_user_for_page(
                 "page:admin_access_denied").__str__()}
         )
 
-    user = await crud.get_user_by_username(db, token_data.sub)
+    user = await get_user_by_token_subject(db, token_data.sub)
     if not user or user.user_type != UserType.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_303_SEE_OTHER,
@@ -0,0 +1,125 @@
+import time
+
+from typing import Dict, Optional
+
+import jinja2
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+from app.core.cache import user_cache
+from app.core.security import get_password_pool_stats
+from app.database.query_log import RequestQueryLog, add_request_observer, add_statement_observer, install_query_log
+from app.database.session import engine, replica_engine, get_pool_stats
+from app.pages.routes.utils import templates
+
+
+HTTP_REQUEST_DURATION = metrics.Histogram(
+    "http_request_duration_seconds", "Request latency by route.", ("method", "route", "status"))
+HTTP_REQUESTS_IN_PROGRESS = metrics.Gauge(
+    "http_requests_in_progress", "Requests currently being served.", ("method",))
+HTTP_REQUEST_DB_QUERIES = metrics.Histogram(
+    "http_request_db_queries", "Database statements issued per request.", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100))
+HTTP_REQUEST_DB_DURATION = metrics.Histogram(
+    "http_request_db_duration_seconds", "Time spent in database statements per request.", ("route",))
+DB_QUERY_DURATION = metrics.Histogram(
+    "db_query_duration_seconds", "Database statement latency.", ("engine",))
+TEMPLATE_RENDER_DURATION = metrics.Histogram(
+    "template_render_duration_seconds", "Template render time.", ("template",))
+
+
+def _route_name(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_PROGRESS.dec(method)
+            HTTP_REQUEST_DURATION.observe(
+                elapsed, method, _route_name(scope), str(status_code))
+
+
+def _observe_statement(engine_name: str, statement: str, elapsed: float, request_log: Optional[RequestQueryLog]) -> None:
+    DB_QUERY_DURATION.observe(elapsed, engine_name)
+
+
+def _observe_request(request_log: RequestQueryLog) -> None:
+    route = _route_name(request_log.scope)
+    HTTP_REQUEST_DB_QUERIES.observe(request_log.total_queries, route)
+    HTTP_REQUEST_DB_DURATION.observe(request_log.total_seconds, route)
+
+
+class InstrumentedTemplate(jinja2.Template):
+    def render(self, *args, **kwargs) -> str:
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            TEMPLATE_RENDER_DURATION.observe(
+                time.perf_counter() - start, self.name or "")
+
+
+def _pool_stats() -> Dict[tuple, float]:
+    values = {}
+    engines = [("primary", engine)]
+    if replica_engine is not None:
+        engines.append(("replica", replica_engine))
+    for engine_name, async_engine in engines:
+        for stat, value in get_pool_stats(async_engine).items():
+            if isinstance(value, (int, float)):
+                values[(engine_name, stat)] = value
+    return values
+
+
+metrics.CallbackGauge("db_pool", "Connection pool statistics.", ("engine", "stat"),
+                      _pool_stats)
+metrics.CallbackGauge("user_cache", "Authenticated user cache statistics.", ("stat",),
+                      lambda: {(stat,): value for stat, value in user_cache.stats().items()})
+metrics.CallbackGauge("password_hash_pool", "Password hashing pool statistics.", ("stat",),
+                      lambda: {(stat,): value for stat, value in get_password_pool_stats().items()})
+
+
+async def metrics_endpoint() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+def install_instrumentation(app: FastAPI, path: str = "/metrics") -> None:
+    """
+    Wire request, database, template and password hashing instrumentation
+    into `app` and expose it at `path`. Nothing is hooked in unless this is
+    called, so disabled metrics cost nothing.
+    """
+    app.add_middleware(MetricsMiddleware)
+    # Statements are timed once, by the query log, for both the metrics and
+    # the slow query / N+1 log.
+    add_statement_observer(_observe_statement)
+    add_request_observer(_observe_request)
+    install_query_log(app)
+    templates.env.template_class = InstrumentedTemplate
+    app.add_api_route(path, metrics_endpoint, methods=["GET"],
+                      include_in_schema=False)
@@ -1,48 +1,102 @@
+from app.core.startup import startup_profile
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from app.utils.static import PrecompressedStaticFiles, load_manifest
+from app.utils.compression import CompressionMiddleware
+from app.database.query_log import install_query_log
+
 from app.api import api_router
 from app.pages import pages_router
 
 
 from app.core.config import settings
 
-from app.core.admin import register_admin_model_view
+from app.core.admin import register_admin_model_view, AdminListPaginationMode, AdminListCountStrategy, AdminListFetchStrategy
+
 
+from app.database import init_db, verify_schema_version
+from app.database.user_changes import user_change_listener
 
-from app.database import init_db
+from app.core.security import shutdown_password_executor
+
+from app.pages.routes.utils import load_all_templates
 
 from app.database.models import User, Address
 
 from contextlib import asynccontextmanager
 
 
+startup_profile.mark("import modules")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await init_db()
+    startup_profile.mark("wait for server")
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        await init_db()
+        startup_profile.mark("create tables")
+    elif settings.DB_VERIFY_SCHEMA_ON_STARTUP:
+        await verify_schema_version()
+        startup_profile.mark("verify schema version")
+    if not settings.TEMPLATES_AUTO_RELOAD:
+        load_all_templates()
+        startup_profile.mark("load templates")
+    if settings.USER_CACHE_MAX_SIZE > 0:
+        user_change_listener.start()
+    if settings.STARTUP_PROFILE:
+        startup_profile.log_report()
     yield
+    await user_change_listener.stop()
+    shutdown_password_executor()
 
 
 register_admin_model_view(
     model=User,
     columns=[User.id, User.username, User.email, User.user_type],
     name="User",
-    name_plural="Users")
+    name_plural="Users",
+    pagination_mode=AdminListPaginationMode.KEYSET,
+    count_strategy=AdminListCountStrategy.CACHED)
 
 register_admin_model_view(
     model=Address,
-    columns=[Address.id, Address.email_address, Address.user_id],
+    columns=[Address.id, Address.email_address, Address.user_id, "user.username"],
     name="Address",
-    name_plural="Addresses")
+    name_plural="Addresses",
+    fetch_strategy=AdminListFetchStrategy.WINDOW)
 
 
+startup_profile.mark("register admin views")
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     lifespan=lifespan
 )
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+if settings.METRICS_ENABLED:
+    from app.instrumentation import install_instrumentation
+    install_instrumentation(app, settings.METRICS_PATH)
+
+if settings.DB_QUERY_LOG_ENABLED:
+    install_query_log(app)
+
+if settings.RESPONSE_GZIP_ENABLED or settings.RESPONSE_BROTLI_ENABLED:
+    app.add_middleware(CompressionMiddleware,
+                       minimum_size=settings.RESPONSE_COMPRESSION_MINIMUM_SIZE,
+                       gzip=settings.RESPONSE_GZIP_ENABLED,
+                       br=settings.RESPONSE_BROTLI_ENABLED)
+
+static_manifest = load_manifest(settings.STATIC_BUILD_DIR)
+if static_manifest:
+    app.mount("/static", PrecompressedStaticFiles(directory=settings.STATIC_BUILD_DIR,
+              manifest=static_manifest), name="static")
+else:
+    app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
 app.include_router(api_router)
 app.include_router(pages_router)
+
+startup_profile.mark("build application")
@@ -5,6 +5,7 @@ from fastapi.exceptions import HTTPException
 from pydantic import BaseModel
 
 from .utils import templates
+from .caching import cached_template_response, get_list_etag, not_modified
 from app.utils.forms import LoginForm
 
 from wtforms import Form
@@ -17,22 +18,51 @@ from app.core.admin.internal import (get_form_class,
                                      get_all_identities,
                                      get_column_names,
                                      get_columns,
-                                     get_formatters,
+                                     get_row_projector,
+                                     get_object_projector,
                                      get_validated_primary_entries,
                                      get_sort_by_keys,
+                                     get_pagination_mode,
+                                     get_keyset_keys,
+                                     get_count_strategy,
+                                     get_count_cache_ttl,
+                                     get_fetch_strategy,
+                                     get_select_from,
+                                     get_load_options,
+                                     get_search_columns,
+                                     get_sortable_column,
+                                     is_column_indexed,
+                                     get_unindexed_sort_policy,
                                      AdminListSortOrder,
+                                     AdminListPaginationMode,
+                                     AdminListCountStrategy,
+                                     AdminListFetchStrategy,
+                                     AdminListUnindexedSortPolicy,
                                      _SORT_BY_KEY_T)
+from app.core.admin.pagination import (encode_cursor,
+                                       decode_cursor,
+                                       keyset_order_by,
+                                       keyset_predicate)
+from app.core.admin.counts import (get_cached_count,
+                                   set_cached_count,
+                                   estimate_count)
+from app.core.admin.filters import (build_filters,
+                                    build_search_clause,
+                                    get_filter_fields)
 
 from app.core.admin.internal import identity_exists
-from app.dependencies import DBDependency, get_current_admin_user_for_page
+from app.dependencies import DBDependency, ReadDBDependency, get_current_admin_user_for_page
+from app.database.session import get_session_factory
 
 
-from sqlalchemy import Column, func
+from sqlalchemy import Column, Table, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql import select, asc, desc
-from typing import List, Any, Dict, Optional
+from sqlalchemy.sql.elements import ColumnElement, Label
+from typing import List, Any, Awaitable, Callable, Dict, Optional, Tuple
 
+import asyncio
 import logging
 
 
@@ -43,6 +73,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Label of the `count(*) OVER ()` column selected by list_model_rows(with_total=True)
+TOTAL_ROWS_LABEL = "admin_total_rows"
+
 
 class _AdminSideBarItem(BaseModel):
     title: str
@@ -62,10 +95,23 @@ async def list_model_rows(
     db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
-    sort_by_keys: Optional[List[_SORT_BY_KEY_T]] = None
+    sort_by_keys: Optional[List[_SORT_BY_KEY_T]] = None,
+    where: Optional[List[ColumnElement]] = None,
+    with_total: bool = False,
+    select_from: Optional[Any] = None,
 ):
+    """
+    With `with_total`, each row also carries the number of rows matching
+    `where` in a trailing TOTAL_ROWS_LABEL column. `select_from` is the join
+    needed by relationship columns, see `get_select_from`.
+    """
     try:
-        query = select(*columns).offset(skip).limit(limit)
+        select_columns = list(columns)
+        if with_total:
+            select_columns.append(func.count().over().label(TOTAL_ROWS_LABEL))
+        query = select(*select_columns).where(*where or []).offset(skip).limit(limit)
+        if select_from is not None:
+            query = query.select_from(select_from)
 
         if sort_by_keys:
             for key in sort_by_keys:
@@ -85,9 +131,63 @@ async def list_model_rows(
         return []
 
 
-async def get_count(db: AsyncSession, columns: List[Column]) -> int:
+async def list_model_rows_keyset(
+    columns: List[Column],
+    db: AsyncSession,
+    keyset_keys: List[Tuple[Column, AdminListSortOrder]],
+    limit: int = 100,
+    after: Optional[List[Any]] = None,
+    before: Optional[List[Any]] = None,
+    where: Optional[List[ColumnElement]] = None,
+    select_from: Optional[Any] = None,
+) -> Tuple[List[Any], bool]:
+    """
+    Returns one page of rows following `after` (or preceding `before`) and
+    whether more rows exist in that direction.
+    """
+    backwards = before is not None
+    cursor_values = before if backwards else after
+
+    key_columns = [column for column, _ in keyset_keys]
+    select_columns = columns + [column for column in key_columns
+                                if not any(column is c for c in columns)]
+
+    try:
+        query = select(*select_columns).where(*where or [])
+        if select_from is not None:
+            query = query.select_from(select_from)
+        if cursor_values is not None:
+            query = query.where(keyset_predicate(
+                keyset_keys, cursor_values, backwards=backwards))
+        query = query.order_by(
+            *keyset_order_by(keyset_keys, backwards=backwards)).limit(limit + 1)
+
+        result = await db.execute(query)
+        rows = result.all()
+    except SQLAlchemyError as e:
+        logger.error(f"Error listing rows: {e}")
+        return [], False
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+    return rows, has_more
+
+
+def _get_cursor(row: Any, keyset_keys: List[Tuple[Column, AdminListSortOrder]]) -> str:
+    return encode_cursor([getattr(row, column.name) for column, _ in keyset_keys])
+
+
+def _get_table(columns: List[Column]) -> Table:
+    # Relationship columns are labels over joined tables.
+    return next(column.table for column in columns if not isinstance(column, Label))
+
+
+async def get_count(db: AsyncSession, columns: List[Column], where: Optional[List[ColumnElement]] = None) -> int:
     try:
-        query = select(func.count()).select_from(columns[0].table)
+        query = select(func.count()).select_from(
+            _get_table(columns)).where(*where or [])
         result = await db.execute(query)
         count = result.scalar()
         return count
@@ -96,52 +196,208 @@ async def get_count(db: AsyncSession, columns: List[Column]) -> int:
         return -1
 
 
+def needs_exact_count(identity: str, where: Optional[List[ColumnElement]] = None) -> bool:
+    """
+    Whether `get_total_rows` would run a `count(*)` query.
+    """
+    if where:
+        return True
+    count_strategy = get_count_strategy(identity)
+    if count_strategy == AdminListCountStrategy.CACHED:
+        return get_cached_count(identity) is None
+    return count_strategy == AdminListCountStrategy.EXACT
+
+
+async def get_total_rows(db: AsyncSession, identity: str, columns: List[Column], where: Optional[List[ColumnElement]] = None) -> Tuple[int, bool]:
+    """
+    Returns the row count according to the registered count strategy and
+    whether it is approximate. Filtered counts are always exact.
+    """
+    if where:
+        return await get_count(db, columns, where), False
+
+    count_strategy = get_count_strategy(identity)
+
+    if count_strategy == AdminListCountStrategy.ESTIMATED:
+        try:
+            # A failed statement aborts the whole transaction on PostgreSQL;
+            # the savepoint keeps it usable for the exact count fallback.
+            async with db.begin_nested():
+                estimate = await estimate_count(db, _get_table(columns))
+        except SQLAlchemyError as e:
+            logger.error(f"Error estimating count: {e}")
+            estimate = None
+        if estimate is not None:
+            return estimate, True
+
+    if count_strategy == AdminListCountStrategy.CACHED:
+        count = get_cached_count(identity)
+        if count is None:
+            count = await get_count(db, columns)
+            if count >= 0:
+                set_cached_count(identity, count,
+                                 get_count_cache_ttl(identity))
+        return count, False
+
+    return await get_count(db, columns), False
+
+
+async def fetch_page_and_total(
+    db: AsyncSession,
+    identity: str,
+    columns: List[Column],
+    where: Optional[List[ColumnElement]],
+    fetch_rows: Callable[..., Awaitable[Tuple[List[Any], bool]]],
+    keyset: bool = False,
+) -> Tuple[List[Any], bool, int, bool]:
+    """
+    Fetch a page with `fetch_rows(session, with_total=False)` together with
+    the row count, combined according to the registered fetch strategy.
+    Returns the rows, whether more follow, the count and whether it is
+    approximate.
+    """
+    total_rows = None
+    total_rows_approximate = False
+    fetch_strategy = get_fetch_strategy(identity)
+
+    if fetch_strategy == AdminListFetchStrategy.SEQUENTIAL or not needs_exact_count(identity, where):
+        rows, has_more = await fetch_rows(db)
+    elif fetch_strategy == AdminListFetchStrategy.WINDOW and not keyset:
+        rows, has_more = await fetch_rows(db, with_total=True)
+        # A page past the end has no rows to carry the total; it is counted below.
+        if rows:
+            total_rows = getattr(rows[0], TOTAL_ROWS_LABEL)
+            if not where and get_count_strategy(identity) == AdminListCountStrategy.CACHED:
+                set_cached_count(identity, total_rows,
+                                 get_count_cache_ttl(identity))
+    else:
+        # CONCURRENT, or WINDOW on a keyset view, where the cursor predicate
+        # would limit a window count: count on a second connection.
+        async with get_session_factory(db)() as count_db:
+            (total_rows, total_rows_approximate), (rows, has_more) = await asyncio.gather(
+                get_total_rows(count_db, identity, columns, where), fetch_rows(db))
+
+    if total_rows is None:
+        total_rows, total_rows_approximate = await get_total_rows(db, identity, columns, where)
+    return rows, has_more, total_rows, total_rows_approximate
+
+
 @router.get("/", name="page:admin_index", dependencies=[Depends(get_current_admin_user_for_page)])
 async def index(request: Request,
                 ):
     items = get_sidebar_items()
-    return templates.TemplateResponse("admin/index.html", {
-        "request": request,
+    return cached_template_response(request, "admin/index.html", {
         "sidebar_items": items,
     })
 
 
-class _RowAttributes(BaseModel):
-    primary_entries: dict[str, Any]
-    display_entries: dict[str, Any]
-
-
 @router.get("/{identity}/list", name="page:admin_list", dependencies=[Depends(get_current_admin_user_for_page), Depends(identity_exists)])
 async def admin_list(
     request: Request,
     identity: str,
-    db: DBDependency,
+    db: ReadDBDependency,
     page: int = Query(1, ge=1),
     pageSize: int = Query(10, enum=[10, 20, 50, 100]),
+    after: Optional[str] = Query(None),
+    before: Optional[str] = Query(None),
+    sort: Optional[str] = Query(None),
+    order: AdminListSortOrder = Query(AdminListSortOrder.ASCENDING),
+    q: Optional[str] = Query(None),
 ):
+    etag = get_list_etag(request, identity)
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
 
     column_names = get_column_names(identity)
     columns = get_columns(identity)
     items = get_sidebar_items(identity)
-    formatters = get_formatters(identity)
     name = get_name(identity)
     name_plural = get_name_plural(identity)
 
-    total_rows = await get_count(db, columns)
+    # Sorting, filtering and searching requested through query parameters
+    list_query_params: Dict[str, str] = {}
+    sort_warning = None
+    sort_by_keys = get_sort_by_keys(identity)
+    if sort:
+        sort_column = get_sortable_column(identity, sort)
+        if sort_column is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot sort by '{sort}'")
+        if not is_column_indexed(identity, sort):
+            policy = get_unindexed_sort_policy(identity)
+            if policy == AdminListUnindexedSortPolicy.REFUSE:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=f"Sorting by '{sort}' requires an index")
+            if policy == AdminListUnindexedSortPolicy.WARN:
+                sort_warning = f"'{sort}' is not indexed; sorting by it scans the whole table."
+                logger.warning(
+                    f"Unindexed sort on {identity}.{sort} requested")
+        # The primary key breaks ties, so rows with equal sort values keep a
+        # stable order across pages.
+        sort_by_keys = get_keyset_keys(identity, [(sort_column, order)])
+        list_query_params.update(sort=sort, order=order.value)
+
+    try:
+        where, applied_filters = build_filters(columns, request.query_params)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    list_query_params.update(applied_filters)
+
+    search_columns = get_search_columns(identity)
+    if q and search_columns:
+        where.append(build_search_clause(search_columns, q))
+        list_query_params["q"] = q
+
+    pagination_mode = get_pagination_mode(identity)
+    next_cursor = None
+    prev_cursor = None
+    keyset_keys = None
+    after_values = None
+    before_values = None
+
+    if pagination_mode == AdminListPaginationMode.KEYSET:
+        keyset_keys = get_keyset_keys(
+            identity, sort_by_keys if sort else None)
+        key_columns = [column for column, _ in keyset_keys]
+        try:
+            after_values = decode_cursor(
+                after, key_columns) if after else None
+            before_values = decode_cursor(
+                before, key_columns) if before else None
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    select_from = get_select_from(identity)
+
+    async def fetch_rows(session: AsyncSession, with_total: bool = False) -> Tuple[List[Any], bool]:
+        if keyset_keys is not None:
+            return await list_model_rows_keyset(
+                columns, session, keyset_keys, limit=pageSize, after=after_values, before=before_values, where=where,
+                select_from=select_from)
+        rows = await list_model_rows(columns, session, skip=(page - 1) * pageSize, limit=pageSize,
+                                     sort_by_keys=sort_by_keys, where=where, with_total=with_total,
+                                     select_from=select_from)
+        return rows, False
+
+    rows, has_more, total_rows, total_rows_approximate = await fetch_page_and_total(
+        db, identity, columns, where, fetch_rows, keyset=keyset_keys is not None)
     total_pages = (total_rows + pageSize - 1) // pageSize  # Ceiling division
 
-    sort_by_keys = get_sort_by_keys(identity)
+    if keyset_keys is not None:
+        if before_values is not None:
+            has_prev, has_next = has_more, True
+        else:
+            has_prev, has_next = after_values is not None, has_more
 
-    rows = await list_model_rows(columns, db, skip=(page - 1) * pageSize, limit=pageSize, sort_by_keys=sort_by_keys)
+        if rows and has_next:
+            next_cursor = _get_cursor(rows[-1], keyset_keys)
+        if rows and has_prev:
+            prev_cursor = _get_cursor(rows[0], keyset_keys)
 
-    _rows = []
-    for row in rows:
-        primary_entries = {column.name: getattr(
-            row, column.name) for column in columns if column.primary_key}
-        display_entries = {column.name: formatters[column](
-            getattr(row, column.name)) for column in columns}
-        _rows.append(_RowAttributes(
-            primary_entries=primary_entries, display_entries=display_entries))
+    _rows = get_row_projector(identity)(rows)
 
     return templates.TemplateResponse("admin/list.html", {
         "request": request,
@@ -156,7 +412,20 @@ async def admin_list(
         "current_page": page,
         "total_pages": total_pages,
         "total_rows": total_rows,
-    })
+        "total_rows_approximate": total_rows_approximate,
+        "pagination_mode": pagination_mode.value,
+        "next_cursor": next_cursor,
+        "prev_cursor": prev_cursor,
+        "column_keys": [column.name for column in columns],
+        "sort": sort,
+        "order": order.value,
+        "sort_warning": sort_warning,
+        "q": q or "",
+        "searchable": bool(search_columns),
+        "filter_fields": get_filter_fields(columns),
+        "applied_filters": applied_filters,
+        "list_query_params": list_query_params,
+    }, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
 
 
 @router.get("/{identity}/create", name="page:admin_create", dependencies=[Depends(get_current_admin_user_for_page), Depends(identity_exists)])
@@ -169,24 +438,24 @@ async def admin_create(request: Request,
     form: Form = form_cls()
 
     items = get_sidebar_items(identity)
-    return templates.TemplateResponse("admin/create.html", {
-        "request": request,
+    return cached_template_response(request, "admin/create.html", {
         "name": name,
         "identity": identity,
         "sidebar_items": items,
         "form": form,
-    })
+    }, identity=identity)
 
 
 @router.get("/{identity}/read", name="page:admin_read", dependencies=[Depends(get_current_admin_user_for_page), Depends(identity_exists)])
 async def read_item(
     request: Request,
     identity: str,
-    db: DBDependency,
+    db: ReadDBDependency,
     primary_entries=Depends(get_validated_primary_entries),
 ):
     model = get_model(identity)
-    obj = await db.get(model, primary_entries)
+    # Relationship columns are loaded in the same query.
+    obj = await db.get(model, primary_entries, options=get_load_options(identity))
     if obj is None:
         return templates.TemplateResponse("admin/error.html", {
             "request": request,
@@ -194,10 +463,7 @@ async def read_item(
             "details": "Item not found",
         })
 
-    formatters = get_formatters(identity)
-    obj = {column.name: getattr(obj, column.name)
-           for column in obj.__table__.columns}
-    display_entries = {k: formatters[k](v) for k, v in obj.items()}
+    display_entries = get_object_projector(identity)(obj)
     items = get_sidebar_items(identity)
     name = get_name(identity)
 
@@ -0,0 +1,88 @@
+import hashlib
+import time
+import uuid
+
+from typing import Any, Dict, Hashable, Optional
+
+import jinja2
+from markupsafe import Markup
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.admin.versions import get_model_version, ADMIN_WRITE_STAMP_COOKIE
+
+from .utils import templates
+
+
+render_cache = TTLCache(maxsize=settings.ADMIN_RENDER_CACHE_MAX_SIZE,
+                        ttl=settings.ADMIN_RENDER_CACHE_TTL_SECONDS)
+
+# Distinguishes this worker's ETags from those issued by other workers, whose
+# model version counters differ.
+_WORKER_TOKEN = uuid.uuid4().hex
+
+
+def _render_cached(cache_key: Hashable, template_name: str, context: Dict[str, Any]) -> str:
+    html = render_cache.get(cache_key)
+    if html is None:
+        html = templates.get_template(template_name).render(context)
+        render_cache.set(cache_key, html)
+    return html
+
+
+def cached_template_response(request: Request, template_name: str, context: Dict[str, Any], identity: Optional[str] = None) -> HTMLResponse:
+    """
+    Render a page that is identical for every admin user, reusing the markup
+    until the model version of `identity` changes or the entry expires.
+    """
+    cache_key = (template_name, identity,
+                 get_model_version(identity) if identity else 0, str(request.base_url))
+    return HTMLResponse(_render_cached(cache_key, template_name, {"request": request, **context}))
+
+
+@jinja2.pass_context
+def cached_include(context: jinja2.runtime.Context, template_name: str, *key: Hashable) -> Markup:
+    """
+    Template global rendering `template_name` with the current context, cached
+    under `key` (plus the base URL, since the markup contains absolute URLs).
+    """
+    cache_key = (template_name, str(context["request"].base_url), *key)
+    return Markup(_render_cached(cache_key, template_name, context.get_all()))
+
+
+templates.env.globals['cached_include'] = cached_include
+
+
+def get_list_etag(request: Request, identity: str) -> str:
+    raw = ":".join([
+        _WORKER_TOKEN,
+        identity,
+        str(get_model_version(identity)),
+        str(int(time.time()) // settings.ADMIN_LIST_ETAG_MAX_AGE_SECONDS),
+        request.cookies.get(ADMIN_WRITE_STAMP_COOKIE, ""),
+        request.url.query,
+    ])
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: a list of entity tags, any of which
+    # may carry a W/ prefix, or "*" matching any current representation.
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -1,11 +1,54 @@
 from fastapi.templating import Jinja2Templates
 from starlette.requests import Request
 from urllib.parse import urlencode
+from typing import List, Optional
 import json
+import os
 
-templates = Jinja2Templates(directory="templates")
+import jinja2
 
+from app.core.config import settings
+from app.utils.static import load_manifest
 
+
+def _make_bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    if settings.TEMPLATES_BYTECODE_CACHE_DIR is None:
+        return None
+    os.makedirs(settings.TEMPLATES_BYTECODE_CACHE_DIR, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(settings.TEMPLATES_BYTECODE_CACHE_DIR)
+
+
+templates = Jinja2Templates(env=jinja2.Environment(
+    loader=jinja2.FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=settings.TEMPLATES_AUTO_RELOAD,
+    bytecode_cache=_make_bytecode_cache(),
+))
+
+
+def load_all_templates() -> List[str]:
+    """
+    Compile every template into the environment's cache (and the bytecode
+    cache, if configured). Returns the names of the loaded templates.
+    """
+    names = templates.env.list_templates()
+    for name in names:
+        templates.env.get_template(name)
+    return names
+
+
+_static_manifest = load_manifest(settings.STATIC_BUILD_DIR)
+
+
+@jinja2.pass_context
+def static_url(context: jinja2.runtime.Context, path: str) -> str:
+    """
+    URL of a static asset, resolved to its fingerprinted name when built.
+    """
+    return str(context["request"].url_for("static", path=_static_manifest.get(path, path)))
+
+
+templates.env.globals['static_url'] = static_url
 templates.env.globals['min'] = min
 templates.env.globals['max'] = max
 
@@ -34,3 +77,16 @@ def merge_dicts(d: dict, *args: dict):
 
 
 templates.env.globals['merge_dicts'] = merge_dicts
+
+
+def humanize_count(count: int) -> str:
+    if count < 10**3:
+        return str(count)
+    for threshold, suffix in ((10**3, "K"), (10**6, "M"), (10**9, "B")):
+        # Round before picking the unit, so 999_999 reads 1M rather than 1000K.
+        value = round(count / threshold, 1)
+        if value < 1000 or suffix == "B":
+            return f"{value:.1f}".rstrip("0").rstrip(".") + suffix
+
+
+templates.env.globals['humanize_count'] = humanize_count
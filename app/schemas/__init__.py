@@ -1,2 +1,3 @@
 from .user import *
-from .token import *
\ No newline at end of file
+from .token import *
+from .admin import *
\ No newline at end of file
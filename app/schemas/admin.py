@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+from typing import Any, Dict, List
+
+
+class BulkRowError(BaseModel):
+    row: int
+    errors: Any
+
+
+class BulkCreateResult(BaseModel):
+    detail: str
+    created: int
+    errors: List[BulkRowError]
+
+
+class BulkUpdateResult(BaseModel):
+    detail: str
+    updated: int
+    errors: List[BulkRowError]
+
+
+class BatchDeleteResult(BaseModel):
+    detail: str
+    deleted: int
+    missing: List[Dict[str, Any]]
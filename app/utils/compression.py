@@ -0,0 +1,148 @@
+from typing import Dict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """
+    Map each content coding in an Accept-Encoding header to its q-value.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    return qualities
+
+
+def accepted_quality(qualities: Dict[str, float], coding: str) -> float:
+    """
+    q-value of `coding` under parsed Accept-Encoding `qualities`, falling back
+    to "*"; 0 means the coding is not acceptable.
+    """
+    return qualities.get(coding, qualities.get("*", 0.0))
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least `minimum_size` bytes with brotli or gzip,
+    whichever the client prefers by q-value (brotli on a tie); codings with
+    q=0 are never used. Responses that already
+    carry a Content-Encoding, such as precompressed static files, are passed
+    through unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip: bool = True, br: bool = True, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+        self.br = br and brotli is not None
+        self.gzip_app = GZipMiddleware(
+            app, minimum_size=minimum_size) if gzip else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            qualities = parse_accept_encoding(
+                Headers(scope=scope).get("Accept-Encoding", ""))
+            br_quality = accepted_quality(qualities, "br") if self.br else 0.0
+            # GZipMiddleware only compresses when gzip is named explicitly.
+            gzip_quality = qualities.get(
+                "gzip", 0.0) if self.gzip_app is not None else 0.0
+            if br_quality > 0 and br_quality >= gzip_quality:
+                responder = BrotliResponder(
+                    self.app, self.minimum_size, self.brotli_quality)
+                await responder(scope, receive, send)
+                return
+            if gzip_quality > 0:
+                await self.gzip_app(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class BrotliResponder:
+    """
+    Brotli counterpart of starlette's GZipResponder.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.send: Send = None  # type: ignore
+        self.initial_message: Message = {}
+        self.started = False
+        self.content_encoding_set = False
+        self.compressor = brotli.Compressor(quality=quality)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_brotli)
+
+    def _set_headers(self, content_length: int | None) -> None:
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        headers["Content-Encoding"] = "br"
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+
+    async def send_with_brotli(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Don't send the initial message until we've determined how to
+            # modify the outgoing headers correctly.
+            self.initial_message = message
+            headers = Headers(raw=self.initial_message["headers"])
+            self.content_encoding_set = "content-encoding" in headers
+        elif message_type == "http.response.body" and self.content_encoding_set:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+        elif message_type == "http.response.body" and not self.started:
+            self.started = True
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) < self.minimum_size and not more_body:
+                # Don't apply compression to small outgoing responses.
+                await self.send(self.initial_message)
+                await self.send(message)
+            elif not more_body:
+                body = self.compressor.process(body) + self.compressor.finish()
+                self._set_headers(len(body))
+                message["body"] = body
+                await self.send(self.initial_message)
+                await self.send(message)
+            else:
+                # Initial body in streaming response.
+                self._set_headers(None)
+                message["body"] = self.compressor.process(
+                    body) + self.compressor.flush()
+                await self.send(self.initial_message)
+                await self.send(message)
+        elif message_type == "http.response.body":
+            # Remaining body in streaming response.
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            data = self.compressor.process(body)
+            data += self.compressor.flush() if more_body else self.compressor.finish()
+            message["body"] = data
+            await self.send(message)
+        else:
+            await self.send(message)
@@ -0,0 +1,81 @@
+import json
+import mimetypes
+import os
+
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from app.utils.compression import parse_accept_encoding, accepted_quality
+
+
+MANIFEST_NAME = "manifest.json"
+
+# Precompressed variants written next to each file by build_static.py, in order of preference.
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def load_manifest(build_dir: Optional[str]) -> Dict[str, str]:
+    """
+    Mapping from source asset paths (e.g. "css/admin.css") to their
+    fingerprinted names, or an empty dict if no build is available.
+    """
+    if build_dir is None:
+        return {}
+    try:
+        with open(os.path.join(build_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _preferred_encodings(scope: Scope) -> List[Tuple[str, str]]:
+    """
+    The (encoding, suffix) pairs of ENCODING_SUFFIXES the client accepts, by
+    descending q-value; ties keep the ENCODING_SUFFIXES order.
+    """
+    qualities = parse_accept_encoding(
+        Headers(scope=scope).get("accept-encoding", ""))
+    ranked = sorted(ENCODING_SUFFIXES,
+                    key=lambda item: -accepted_quality(qualities, item[0]))
+    return [(encoding, suffix) for encoding, suffix in ranked
+            if accepted_quality(qualities, encoding) > 0]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Serves the output of build_static.py: picks the brotli or gzip variant
+    the client prefers by Accept-Encoding q-value, and marks fingerprinted
+    files immutable.
+    """
+
+    def __init__(self, *args, manifest: Dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fingerprinted = set(manifest.values())
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+        for encoding, suffix in _preferred_encodings(scope):
+            try:
+                response = await super().get_response(path + suffix, scope)
+            except HTTPException:
+                continue
+            response.headers["content-encoding"] = encoding
+            media_type, _ = mimetypes.guess_type(path)
+            if media_type is not None:
+                response.headers["content-type"] = media_type
+            break
+
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["vary"] = "Accept-Encoding"
+        if path.replace(os.sep, "/") in self.fingerprinted:
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,121 @@
+"""
+Benchmark batch deletion by primary key.
+
+Compares the previous OR-of-ANDs filter with the row value IN list and the
+`= ANY(array)` strategies used by `admin_batch_delete`, deleting 1k, 10k and
+100k rows from scratch tables. Results are printed as JSON.
+
+Usage:
+    python -m benchmarks.batch_delete [--database-url URL] [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from typing import Any, Dict, List
+
+from sqlalchemy import Column, Integer, MetaData, Table, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.sql import delete, insert
+
+from app.core.admin.bulk import delete_rows
+
+
+metadata = MetaData()
+
+composite_table = Table(
+    "bench_batch_delete_composite", metadata,
+    Column("a", Integer, primary_key=True),
+    Column("b", Integer, primary_key=True),
+)
+
+single_table = Table(
+    "bench_batch_delete_single", metadata,
+    Column("id", Integer, primary_key=True),
+)
+
+
+async def _seed(db: AsyncSession, table: Table, size: int) -> List[tuple]:
+    await db.execute(delete(table))
+    if len(table.primary_key.columns) == 1:
+        keys = [(i,) for i in range(size)]
+    else:
+        keys = [(i // 100, i % 100) for i in range(size)]
+    names = [column.name for column in table.primary_key.columns]
+    for i in range(0, size, 10000):
+        await db.execute(insert(table), [dict(zip(names, key))
+                                         for key in keys[i:i + 10000]])
+    await db.commit()
+    return keys
+
+
+async def _delete_or_of_ands(db: AsyncSession, table: Table, keys: List[tuple]) -> int:
+    columns = list(table.primary_key.columns)
+    filters = [and_(*(column == value for column, value in zip(columns, key)))
+               for key in keys]
+    result = await db.execute(delete(table).where(or_(*filters)))
+    return result.rowcount
+
+
+async def _run(db: AsyncSession, table: Table, strategy: str, size: int) -> Dict[str, Any]:
+    keys = await _seed(db, table, size)
+    names = [column.name for column in table.primary_key.columns]
+
+    start = time.perf_counter()
+    try:
+        if strategy == "or_of_ands":
+            deleted = await _delete_or_of_ands(db, table, keys)
+        else:
+            deleted = len(await delete_rows(db, table, names, keys, use_any=strategy == "any"))
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        return {"table": table.name, "strategy": strategy, "rows": size, "error": str(e)[:200]}
+
+    return {
+        "table": table.name,
+        "strategy": strategy,
+        "rows": size,
+        "deleted": deleted,
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+async def main(database_url: str, sizes: List[int]) -> List[Dict[str, Any]]:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    results = []
+    try:
+        async with AsyncSession(engine) as db:
+            for size in sizes:
+                for strategy in ("or_of_ands", "tuple_in"):
+                    results.append(await _run(db, composite_table, strategy, size))
+                for strategy in ("or_of_ands", "tuple_in", "any"):
+                    if strategy == "any" and engine.dialect.name != "postgresql":
+                        continue
+                    results.append(await _run(db, single_table, strategy, size))
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", default=None,
+                        help="defaults to the application's database")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        from app.core.config import settings
+        database_url = settings.SQLALCHEMY_DATABASE_URI
+
+    print(json.dumps(asyncio.run(main(database_url, args.sizes)), indent=2))
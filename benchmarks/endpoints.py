@@ -0,0 +1,315 @@
+"""
+Benchmark the auth, admin list and admin CRUD endpoints.
+
+Seeds N users with addresses into the application's database, or the one
+given by --database-url, then measures
+throughput and p50/p99 latency of `/api/login/access-token`,
+`/api/login/test-token`, `page:admin_list` at several page depths and sizes,
+`admin_create`, `admin_update` and `admin_batch_delete`. Requests go through
+the application in-process, with its lifespan running as in a served worker,
+unless --base-url points at a running server. The database must already be at
+the latest migration (`alembic upgrade head`).
+Only the rows seeded by this run, and the addresses created for its users,
+are removed afterwards, so other data in the database is left alone.
+Results are written as JSON so runs can be compared across commits.
+
+Requires httpx.
+
+Usage:
+    python -m benchmarks.endpoints [--database-url URL] [--users 1000] [--requests 200] [--concurrency 10] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import secrets
+import subprocess
+import time
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy.engine import make_url
+from sqlalchemy.sql import delete, insert, select
+
+# Application modules are imported where they are used: the settings and
+# engines are created on import, after --database-url has been applied.
+
+
+# Unique per run, so concurrent or aborted runs never collide on usernames.
+BENCH_PREFIX = f"bench_{secrets.token_hex(4)}_"
+BENCH_PASSWORD = "bench-password"
+ADMIN_USERNAME = f"{BENCH_PREFIX}admin"
+
+
+def _use_database(database_url: str) -> None:
+    """
+    Point the application settings at `database_url`.
+    """
+    url = make_url(database_url)
+    os.environ.update(
+        POSTGRES_SERVER=url.host or "localhost",
+        POSTGRES_PORT=str(url.port or 5432),
+        POSTGRES_USER=url.username or "",
+        POSTGRES_PASSWORD=url.password or "",
+        POSTGRES_DB=url.database or "",
+    )
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    # Nearest-rank percentile
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1,
+                       int(round(percentile / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def _measure(name: str, send: Callable[[int], Awaitable[httpx.Response]], requests: int, concurrency: int, **details: Any) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: Dict[int, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            response = await send(i)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors[response.status_code] = errors.get(
+                    response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "name": name,
+        **details,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": round(elapsed, 4),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else None,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def _cleanup(user_ids: List[int]) -> None:
+    """
+    Delete the users seeded by this run and every address belonging to them,
+    including those created through the admin API while benchmarking.
+    """
+    from app.database.models import Address, User
+    from app.database.session import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        for i in range(0, len(user_ids), 10000):
+            chunk = user_ids[i:i + 10000]
+            await db.execute(delete(Address).where(Address.user_id.in_(chunk)))
+            await db.execute(delete(User).where(User.id.in_(chunk)))
+        await db.commit()
+
+
+async def _seed(users: int, addresses_per_user: int) -> Dict[str, List[int]]:
+    from app.core.security import get_password_hash
+    from app.database.models import Address, User
+    from app.database.session import AsyncSessionLocal
+    from app.enums import UserType
+
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+    async with AsyncSessionLocal() as db:
+        admin_id = await db.scalar(insert(User).values(
+            username=ADMIN_USERNAME,
+            full_name="Benchmark Admin",
+            hashed_password=hashed_password,
+            email=f"{ADMIN_USERNAME}@example.com",
+            user_type=UserType.ADMIN,
+        ).returning(User.id))
+        user_ids = []
+        for i in range(0, users, 10000):
+            result = await db.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), [{
+                "username": f"{BENCH_PREFIX}{j}",
+                "full_name": f"Benchmark User {j}",
+                "hashed_password": hashed_password,
+                "email": f"{BENCH_PREFIX}{j}@example.com",
+                "user_type": UserType.COMMON,
+            } for j in range(i, min(i + 10000, users))])
+            user_ids.extend(result.all())
+
+        rows = [{"email_address": f"{BENCH_PREFIX}{user_id}_{k}@example.com", "user_id": user_id}
+                for user_id in user_ids for k in range(addresses_per_user)]
+        for i in range(0, len(rows), 10000):
+            await db.execute(insert(Address), rows[i:i + 10000])
+
+        result = await db.execute(select(Address.id).where(
+            Address.user_id.in_(user_ids)).order_by(Address.id))
+        address_ids = list(result.scalars())
+        await db.commit()
+
+    return {"admin_id": admin_id, "user_ids": user_ids, "address_ids": address_ids}
+
+
+async def _list_params(identity: str, page: int, page_size: int) -> Dict[str, Any]:
+    """
+    Query parameters for page `page` of the admin list. Keyset paginated views
+    have no page numbers, so the cursor of the row preceding the page is
+    looked up instead, as if the user had followed the next links.
+    """
+    from app.core.admin import AdminListPaginationMode
+    from app.core.admin.internal import get_keyset_keys, get_pagination_mode
+    from app.core.admin.pagination import encode_cursor, keyset_order_by
+    from app.database.session import AsyncSessionLocal
+
+    if get_pagination_mode(identity) != AdminListPaginationMode.KEYSET or page == 1:
+        return {"page": page, "pageSize": page_size}
+
+    keyset_keys = get_keyset_keys(identity)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(*(column for column, _ in keyset_keys))
+            .order_by(*keyset_order_by(keyset_keys))
+            .offset((page - 1) * page_size - 1).limit(1))
+        row = result.first()
+    if row is None:
+        return {"pageSize": page_size}
+    return {"after": encode_cursor(list(row)), "pageSize": page_size}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    # Also registers the admin views, which _list_params looks up.
+    from app.main import app
+    from app.database.session import engine
+
+    try:
+        if args.base_url:
+            results = await _run_scenarios(args, None, args.base_url)
+        else:
+            # httpx.ASGITransport does not run the lifespan, which verifies
+            # the schema version, preloads templates and starts the user change
+            # listener that enables the user cache.
+            async with app.router.lifespan_context(app):
+                results = await _run_scenarios(
+                    args, httpx.ASGITransport(app=app), "http://bench")
+    finally:
+        await engine.dispose()
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "database_url")},
+        "results": results,
+    }
+
+
+async def _run_scenarios(args: argparse.Namespace, transport: Optional[httpx.AsyncBaseTransport], base_url: str) -> List[Dict[str, Any]]:
+    from app.core.config import settings
+
+    seeded = await _seed(args.users, args.addresses_per_user)
+    user_ids = seeded["user_ids"]
+    address_ids = seeded["address_ids"]
+    api = settings.ADMIN_BASE_URL
+    results = []
+
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=60) as client:
+            response = await client.post("/api/login/access-token",
+                                         data={"username": ADMIN_USERNAME, "password": BENCH_PASSWORD})
+            response.raise_for_status()
+            client.cookies.set("token", response.json()["access_token"])
+
+            results.append(await _measure(
+                "login_access_token",
+                lambda i: client.post("/api/login/access-token",
+                                      data={"username": ADMIN_USERNAME, "password": BENCH_PASSWORD}),
+                args.requests, args.concurrency))
+
+            results.append(await _measure(
+                "login_test_token",
+                lambda i: client.post("/api/login/test-token"),
+                args.requests, args.concurrency))
+
+            for identity in ("user", "address"):
+                for page_size in args.page_sizes:
+                    for page in args.pages:
+                        params = await _list_params(identity, page, page_size)
+                        results.append(await _measure(
+                            "admin_list",
+                            lambda i, identity=identity, params=params: client.get(
+                                f"{api}/{identity}/list", params=params),
+                            args.requests, args.concurrency,
+                            identity=identity, page=page, page_size=page_size))
+
+            results.append(await _measure(
+                "admin_create",
+                lambda i: client.post(f"{api}/address/create", data={
+                    "email_address": f"{BENCH_PREFIX}created_{i}@example.com",
+                    "user_id": str(user_ids[i % len(user_ids)])}),
+                args.requests, args.concurrency))
+
+            results.append(await _measure(
+                "admin_update",
+                lambda i: client.put(f"{api}/address/update", params={"id": address_ids[i % len(address_ids)]}, data={
+                    "email_address": f"{BENCH_PREFIX}updated_{i}@example.com",
+                    "user_id": str(user_ids[i % len(user_ids)])}),
+                args.requests, args.concurrency))
+
+            batch = args.delete_batch_size
+            delete_requests = min(args.requests, len(address_ids) // batch)
+            results.append(await _measure(
+                "admin_batch_delete",
+                lambda i: client.request("DELETE", f"{api}/address/batch_delete", json=[
+                    {"id": address_id} for address_id in address_ids[i * batch:(i + 1) * batch]]),
+                delete_requests, args.concurrency, batch_size=batch))
+    finally:
+        await _cleanup([seeded["admin_id"], *user_ids])
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default=None,
+                        help="benchmark a running server instead of the in-process app")
+    parser.add_argument("--database-url", default=None,
+                        help="seed this database, and run the in-process app against it, "
+                        "instead of the application's database")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--addresses-per-user", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--delete-batch-size", type=int, default=100)
+    parser.add_argument("--output", default=None,
+                        help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    if args.database_url:
+        _use_database(args.database_url)
+        from app.core.config import settings
+        if settings.POSTGRES_REPLICA_DSN:
+            parser.error(
+                "--database-url cannot be combined with POSTGRES_REPLICA_DSN")
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
@@ -0,0 +1,62 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+from app.utils.static import MANIFEST_NAME
+
+
+SOURCE_DIR = "static"
+COMPRESSIBLE_EXTENSIONS = (".css", ".js", ".svg", ".html", ".json", ".txt")
+
+
+def _fingerprint(relative_path: str, content: bytes) -> str:
+    root, ext = os.path.splitext(relative_path)
+    return f"{root}.{hashlib.sha256(content).hexdigest()[:12]}{ext}"
+
+
+def build(build_dir: str) -> dict:
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        print("brotli is not installed, skipping .br variants.")
+
+    shutil.rmtree(build_dir, ignore_errors=True)
+    manifest = {}
+
+    for root, _, files in os.walk(SOURCE_DIR):
+        for filename in files:
+            source = os.path.join(root, filename)
+            relative_path = os.path.relpath(
+                source, SOURCE_DIR).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                content = f.read()
+
+            fingerprinted = _fingerprint(relative_path, content)
+            manifest[relative_path] = fingerprinted
+
+            for name in (relative_path, fingerprinted):
+                target = os.path.join(build_dir, name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, "wb") as f:
+                    f.write(content)
+
+                if filename.endswith(COMPRESSIBLE_EXTENSIONS):
+                    with open(target + ".gz", "wb") as f:
+                        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+                    if brotli is not None:
+                        with open(target + ".br", "wb") as f:
+                            f.write(brotli.compress(content))
+
+    with open(os.path.join(build_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    build_dir = sys.argv[1] if len(sys.argv) > 1 else "static_build"
+    manifest = build(build_dir)
+    print(f"Built {len(manifest)} static assets into {build_dir}.")
@@ -0,0 +1,51 @@
+"""Initial schema
+
+The tables as created by metadata.create_all before migrations were
+introduced. Databases created that way are brought under migration with
+`alembic stamp 0001` followed by `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("username", sa.String(length=30), nullable=False),
+        sa.Column("full_name", sa.Unicode(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        # sqlalchemy_utils EmailType
+        sa.Column("email", sa.Unicode(length=255), nullable=False),
+        sa.Column("user_type", sa.Enum("COMMON", "ADMIN",
+                  name="usertype"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("username"),
+        sa.UniqueConstraint("email"),
+    )
+    op.create_table(
+        "addresses",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email_address", sa.String(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("addresses")
+    op.drop_table("users")
+    sa.Enum(name="usertype").drop(op.get_bind(), checkfirst=True)
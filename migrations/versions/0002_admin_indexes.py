@@ -0,0 +1,38 @@
+"""Index the admin sort, filter and search columns
+
+addresses.user_id backs the foreign key lookups and the user_id filter;
+users.username and users.email are already indexed by their unique
+constraints. The pg_trgm GIN indexes serve the admin's case-insensitive
+substring search.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index("ix_addresses_user_id", "addresses", ["user_id"])
+    op.create_index("ix_users_username_trgm", "users", ["username"],
+                    postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"})
+    op.create_index("ix_users_email_trgm", "users", ["email"],
+                    postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"})
+    op.create_index("ix_addresses_email_address_trgm", "addresses", ["email_address"],
+                    postgresql_using="gin", postgresql_ops={"email_address": "gin_trgm_ops"})
+
+
+def downgrade() -> None:
+    op.drop_index("ix_addresses_email_address_trgm", table_name="addresses")
+    op.drop_index("ix_users_email_trgm", table_name="users")
+    op.drop_index("ix_users_username_trgm", table_name="users")
+    op.drop_index("ix_addresses_user_id", table_name="addresses")
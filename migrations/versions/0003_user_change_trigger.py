@@ -0,0 +1,39 @@
+"""Announce changes to users on the user_changed channel
+
+Each worker listens on the channel to drop cached users and admin user pages,
+whichever process or script changed the row.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+CREATE OR REPLACE FUNCTION notify_user_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('user_changed',
+                      CASE WHEN TG_OP = 'INSERT' THEN NEW.username ELSE OLD.username END);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+    op.execute("""
+CREATE TRIGGER users_notify_changed AFTER INSERT OR UPDATE OR DELETE ON users
+FOR EACH ROW EXECUTE FUNCTION notify_user_changed()
+""")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER users_notify_changed ON users")
+    op.execute("DROP FUNCTION notify_user_changed()")
@@ -0,0 +1,16 @@
+import sys
+import time
+
+from app.core.config import settings
+from app.pages.routes.utils import load_all_templates
+
+
+if __name__ == "__main__":
+    if settings.TEMPLATES_BYTECODE_CACHE_DIR is None:
+        print("TEMPLATES_BYTECODE_CACHE_DIR is not set, nothing to precompile.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    names = load_all_templates()
+    print(
+        f"Precompiled {len(names)} templates into {settings.TEMPLATES_BYTECODE_CACHE_DIR} in {time.perf_counter() - start:.2f}s.")
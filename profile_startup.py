@@ -0,0 +1,72 @@
+"""
+Report where application startup time goes.
+
+Lists the modules slowest to import (from `python -X importtime`), then
+imports the application, runs its lifespan startup and prints the
+startup profile: imports, admin registration, application setup, schema
+verification and template loading. The form classes that admin views build
+lazily on first use are timed as well.
+
+Usage:
+    python profile_startup.py [--top 15] [--skip-lifespan]
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+from typing import List, Tuple
+
+
+def _import_times(module: str) -> List[Tuple[int, int, str]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        sys.exit(result.returncode)
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return entries
+
+
+async def _run_lifespan(app) -> None:
+    async with app.router.lifespan_context(app):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15,
+                        help="number of modules to list")
+    parser.add_argument("--skip-lifespan", action="store_true",
+                        help="do not run the lifespan startup, which connects to the database to verify the schema version")
+    args = parser.parse_args()
+
+    entries = _import_times("app.main")
+    print("Slowest imports of app.main (self / cumulative, ms):")
+    for self_us, cumulative_us, name in sorted(entries, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} {cumulative_us / 1000:8.1f}  {name.strip()}")
+
+    from app.main import app
+    from app.core.admin.internal import get_all_identities, get_form_class, get_primary_key_form_class
+    from app.core.startup import startup_profile
+
+    if not args.skip_lifespan:
+        asyncio.run(_run_lifespan(app))
+
+    start = time.perf_counter()
+    for identity in get_all_identities():
+        get_form_class(identity)
+        get_primary_key_form_class(identity)
+    forms_ms = (time.perf_counter() - start) * 1000
+
+    print("\nStartup profile:")
+    print(startup_profile.report())
+    print(f"\nBuilding the form classes of {len(get_all_identities())} admin views on first use: {forms_ms:.1f} ms")
@@ -1 +1,7 @@
+export TEMPLATES_AUTO_RELOAD=false
+export TEMPLATES_BYTECODE_CACHE_DIR="${TEMPLATES_BYTECODE_CACHE_DIR:-.jinja_cache}"
+export STATIC_BUILD_DIR="${STATIC_BUILD_DIR:-static_build}"
+python precompile_templates.py
+python build_static.py "$STATIC_BUILD_DIR"
+alembic upgrade head
 gunicorn --bind 0000:8000 -w 4 -k uvicorn.workers.UvicornWorker app.main:app
\ No newline at end of file
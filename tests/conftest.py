@@ -0,0 +1,64 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+
+# Settings without defaults. The database under test is TEST_DATABASE_URL
+# (postgresql+asyncpg://...); its tables are dropped and recreated.
+for name, value in {
+    "PROJECT_NAME": "test",
+    "ADMIN_BASE_URL": "/admin",
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_USER": "test",
+    "SECRET_KEY": "test",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+}.items():
+    os.environ.setdefault(name, value)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL:
+    # Point the application's engine and session factories at the test
+    # database. Each test runs its own event loop, so connections must not be
+    # pooled across tests.
+    _url = make_url(TEST_DATABASE_URL)
+    os.environ.update(
+        POSTGRES_SERVER=_url.host or "localhost",
+        POSTGRES_PORT=str(_url.port or 5432),
+        POSTGRES_USER=_url.username or "",
+        POSTGRES_PASSWORD=_url.password or "",
+        POSTGRES_DB=_url.database or "",
+        DB_USE_NULL_POOL="true",
+    )
+
+
+@pytest.fixture
+def run_db():
+    """
+    Returns a function running `test(db)` with a session on freshly created
+    tables in TEST_DATABASE_URL and returning its result.
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from app.database import Base
+    from app.database.session import AsyncSessionLocal, engine
+
+    async def run(test):
+        async with engine.begin() as conn:
+            # The trigram search indexes need pg_trgm (migration 0002).
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSessionLocal() as db:
+                return await test(db)
+        finally:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    return lambda test: asyncio.run(run(test))
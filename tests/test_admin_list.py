@@ -0,0 +1,45 @@
+import pytest
+
+from app.core.admin import AdminListFetchStrategy, register_admin_model_view
+from app.database.models import Address, User
+from app.enums import UserType
+from app.pages.routes.admin import fetch_page_and_total, list_model_rows
+
+
+COLUMNS = [Address.id, Address.email_address]
+
+
+def _fetch_page(run_db, fetch_strategy: AdminListFetchStrategy, page: int, page_size: int = 2):
+    register_admin_model_view(model=Address, columns=COLUMNS,
+                              fetch_strategy=fetch_strategy)
+
+    async def fetch_rows(session, with_total=False):
+        rows = await list_model_rows(COLUMNS, session, skip=(page - 1) * page_size, limit=page_size,
+                                     sort_by_keys=[Address.id], with_total=with_total)
+        return rows, False
+
+    async def test(db):
+        user = User(username="foo", full_name="Foo", hashed_password="hashed",
+                    email="foo@example.com", user_type=UserType.COMMON)
+        db.add(user)
+        await db.flush()
+        db.add_all([Address(email_address=f"foo{i}@example.com", user_id=user.id)
+                    for i in range(3)])
+        await db.commit()
+
+        rows, has_more, total_rows, approximate = await fetch_page_and_total(
+            db, "address", COLUMNS, None, fetch_rows)
+        return [row.email_address for row in rows], total_rows, approximate
+
+    return run_db(test)
+
+
+@pytest.mark.parametrize("fetch_strategy", list(AdminListFetchStrategy))
+def test_fetch_strategies_agree(run_db, fetch_strategy):
+    assert _fetch_page(run_db, fetch_strategy, page=2) == (
+        ["foo2@example.com"], 3, False)
+
+
+@pytest.mark.parametrize("fetch_strategy", list(AdminListFetchStrategy))
+def test_page_past_the_end_is_still_counted(run_db, fetch_strategy):
+    assert _fetch_page(run_db, fetch_strategy, page=5) == ([], 3, False)
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy.sql import select
+
+from app.core.admin.bulk import insert_rows
+from app.database.models import Address, User
+from app.enums import UserType
+
+
+def _bulk_create_user(run_db, use_copy: bool):
+    async def test(db):
+        row = {
+            "username": "foo",
+            "full_name": "Foo",
+            "hashed_password": "hashed",
+            "email": "Foo@Example.COM",
+            "user_type": UserType.COMMON,
+        }
+        created, errors = await insert_rows(db, User, [(0, row)], chunk_size=10, use_copy=use_copy)
+        await db.commit()
+        assert (created, errors) == (1, [])
+
+        result = await db.execute(select(User.username, User.email, User.user_type))
+        return [tuple(row) for row in result]
+
+    return run_db(test)
+
+
+def test_copy_and_insert_store_identical_values(run_db):
+    inserted = _bulk_create_user(run_db, use_copy=False)
+    copied = _bulk_create_user(run_db, use_copy=True)
+
+    assert inserted == [("foo", "foo@example.com", UserType.COMMON)]
+    assert copied == inserted
+
+
+@pytest.mark.parametrize("use_copy", [False, True])
+def test_values_the_driver_cannot_encode_are_reported_per_row(run_db, use_copy):
+    async def test(db):
+        rows = [(0, {"email_address": "foo@example.com", "user_id": 99999999999})]
+        created, errors = await insert_rows(db, Address, rows, chunk_size=10, use_copy=use_copy)
+        await db.commit()
+        return created, [error["row"] for error in errors]
+
+    assert run_db(test) == (0, [0])
@@ -0,0 +1,58 @@
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_their_ttl(clock):
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("foo", 1)
+    cache.set("bar", 2, ttl=5)
+
+    clock[0] += 5
+    assert cache.get("foo") == 1
+    assert cache.get("bar") is None
+    clock[0] += 55
+    assert cache.get("foo") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted_first(clock):
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+    cache.get("foo")
+    cache.set("baz", 3)
+
+    assert cache.get("bar") is None
+    assert (cache.get("foo"), cache.get("baz")) == (1, 3)
+
+
+def test_disabled_cache_stores_nothing(clock):
+    cache = TTLCache(maxsize=10, ttl=60, enabled=False)
+    cache.set("foo", 1)
+    assert len(cache) == 0
+
+    cache.enabled = True
+    cache.set("foo", 1)
+    cache.enabled = False
+    assert cache.get("foo") is None
+
+
+def test_invalidation_bumps_generation():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation
+    cache.set("foo", 1)
+    assert cache.generation == generation
+
+    cache.pop("foo")
+    assert cache.generation == generation + 1
+    cache.clear()
+    assert cache.generation == generation + 2
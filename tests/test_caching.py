@@ -0,0 +1,22 @@
+import pytest
+from starlette.requests import Request
+
+from app.pages.routes.caching import not_modified
+
+
+ETAG = '"abc"'
+
+
+def _request(if_none_match: str) -> Request:
+    return Request({"type": "http", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+@pytest.mark.parametrize("if_none_match", ['"abc"', 'W/"abc"', '"xyz", W/"abc"', "*"])
+def test_not_modified_matches(if_none_match):
+    response = not_modified(_request(if_none_match), ETAG)
+    assert response is not None and response.status_code == 304
+
+
+@pytest.mark.parametrize("if_none_match", ['"xyz"', 'W/"xyz", "abcd"', ""])
+def test_not_modified_does_not_match(if_none_match):
+    assert not_modified(_request(if_none_match), ETAG) is None
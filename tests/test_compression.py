@@ -0,0 +1,14 @@
+import pytest
+
+from app.utils.compression import parse_accept_encoding
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("", {}),
+    ("gzip, br", {"gzip": 1.0, "br": 1.0}),
+    ("br;q=0, gzip", {"br": 0.0, "gzip": 1.0}),
+    ("GZIP; q=0.5, *;q=0.1", {"gzip": 0.5, "*": 0.1}),
+    ("br;q=oops", {"br": 0.0}),
+])
+def test_parse_accept_encoding(accept_encoding, expected):
+    assert parse_accept_encoding(accept_encoding) == expected
@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+from sqlalchemy import (Boolean, Column, Date, Enum, ForeignKey, Index, Integer, MetaData, String, Table,
+                        UniqueConstraint, create_engine)
+from sqlalchemy.sql import insert, select
+
+from app.core.admin.filters import build_filters
+from app.core.admin.internal import _get_indexed_column_names
+from app.enums import UserType
+
+
+metadata = MetaData()
+
+owners = Table("owners", metadata, Column("id", Integer, primary_key=True))
+
+items = Table(
+    "items", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("user_type", Enum(UserType)),
+    Column("active", Boolean),
+    Column("created", Date),
+    Column("code", String),
+    Column("owner_id", ForeignKey("owners.id")),
+    Column("slug", String),
+    UniqueConstraint("code"),
+    Index("ix_items_name_trgm", "name", postgresql_using="gin"),
+    Index("ix_items_slug", "slug"),
+)
+
+COLUMNS = [items.c.id, items.c.name, items.c.user_type,
+           items.c.active, items.c.created]
+
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        metadata.create_all(connection)
+        connection.execute(insert(items), [
+            {"id": 1, "name": "Alpha", "user_type": UserType.ADMIN,
+             "active": True, "created": datetime.date(2024, 1, 1)},
+            {"id": 2, "name": "alphabet", "user_type": UserType.COMMON,
+             "active": False, "created": datetime.date(2024, 2, 1)},
+            {"id": 3, "name": "100% beta", "user_type": UserType.COMMON,
+             "active": True, "created": datetime.date(2024, 3, 1)},
+        ])
+        yield connection
+
+
+def _filter_ids(connection, params):
+    clauses, applied = build_filters(COLUMNS, params)
+    ids = [row.id for row in connection.execute(
+        select(items.c.id).where(*clauses).order_by(items.c.id))]
+    return ids, applied
+
+
+@pytest.mark.parametrize("params, expected_ids", [
+    ({}, [1, 2, 3]),
+    ({"filter_name": "ALPHA"}, [1, 2]),
+    ({"filter_name": "100%"}, [3]),
+    ({"filter_name": "%"}, [3]),
+    ({"filter_user_type": "COMMON"}, [2, 3]),
+    ({"filter_active": "false"}, [2]),
+    ({"filter_id__gte": "2"}, [2, 3]),
+    ({"filter_created__gte": "2024-01-15", "filter_created__lte": "2024-02-15"}, [2]),
+    ({"filter_id": "", "filter_name__gte": "b", "unrelated": "x"}, [1, 2, 3]),
+])
+def test_build_filters(connection, params, expected_ids):
+    ids, applied = _filter_ids(connection, params)
+    assert ids == expected_ids
+    assert applied == {key: value for key, value in params.items()
+                       if value and key.startswith("filter_") and key != "filter_name__gte"}
+
+
+@pytest.mark.parametrize("params", [
+    {"filter_id": "one"},
+    {"filter_user_type": "NOBODY"},
+    {"filter_active": "maybe"},
+    {"filter_created__lte": "yesterday"},
+])
+def test_build_filters_rejects_invalid_values(params):
+    with pytest.raises(ValueError):
+        build_filters(COLUMNS, params)
+
+
+def test_indexed_columns_exclude_foreign_keys_and_trigram_indexes():
+    assert _get_indexed_column_names(items) == {"id", "code", "slug"}
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy import Column, Enum, Integer, MetaData, String, Table, create_engine
+from sqlalchemy.sql import insert, select
+
+from app.core.admin import AdminListSortOrder
+from app.core.admin.pagination import decode_cursor, encode_cursor, keyset_order_by, keyset_predicate
+from app.enums import UserType
+
+
+ASC = AdminListSortOrder.ASCENDING
+DESC = AdminListSortOrder.DESCENDING
+
+metadata = MetaData()
+
+items = Table(
+    "items", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("rank", Integer),
+    Column("name", String),
+    Column("user_type", Enum(UserType)),
+)
+
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        metadata.create_all(connection)
+        # Repeated ranks, so the id has to break ties.
+        connection.execute(insert(items), [
+            {"id": i, "rank": i % 3, "name": f"item {i}", "user_type": UserType.COMMON}
+            for i in range(1, 10)])
+        yield connection
+
+
+def _ids(connection, query):
+    return [row.id for row in connection.execute(query)]
+
+
+@pytest.mark.parametrize("orders", [(ASC, ASC), (DESC, DESC), (ASC, DESC), (DESC, ASC)])
+@pytest.mark.parametrize("backwards", [False, True])
+def test_keyset_predicate_follows_the_ordering(connection, orders, backwards):
+    keys = [(items.c.rank, orders[0]), (items.c.id, orders[1])]
+    order_by = keyset_order_by(keys, backwards=backwards)
+    ordered = connection.execute(
+        select(items.c.id, items.c.rank).order_by(*order_by)).all()
+
+    for position, row in enumerate(ordered):
+        page = _ids(connection, select(items.c.id)
+                    .where(keyset_predicate(keys, [row.rank, row.id], backwards=backwards))
+                    .order_by(*order_by))
+        assert page == [later.id for later in ordered[position + 1:]]
+
+
+@pytest.mark.parametrize("orders", [(ASC, ASC), (ASC, DESC)])
+def test_backwards_ordering_is_reversed(connection, orders):
+    keys = [(items.c.rank, orders[0]), (items.c.id, orders[1])]
+    forwards = _ids(connection, select(items.c.id).order_by(*keyset_order_by(keys)))
+    backwards = _ids(connection, select(items.c.id).order_by(
+        *keyset_order_by(keys, backwards=True)))
+    assert backwards == forwards[::-1]
+
+
+def test_cursor_round_trip():
+    columns = [items.c.id, items.c.name, items.c.user_type]
+    values = [7, "item 7", UserType.ADMIN]
+    assert decode_cursor(encode_cursor(values), columns) == values
+
+
+@pytest.mark.parametrize("cursor", [
+    "@@@",
+    encode_cursor([1, 2]),
+    encode_cursor(["not a number"]),
+    "eyJpZCI6IDF9",  # {"id": 1}
+])
+def test_malformed_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, [items.c.id])
+
+
+def test_unknown_enum_name_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(["NOBODY"]), [items.c.user_type])
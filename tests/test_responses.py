@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.schemas import BulkCreateResult
+from app.utils.responses import FastJSONResponse, model_json_response
+
+
+RESULT = BulkCreateResult(detail="1 items created successfully", created=1,
+                          errors=[{"row": 1, "errors": {"email": ["Invalid email address."]}}])
+
+
+def test_fast_json_response_serializes_models_directly():
+    assert FastJSONResponse(RESULT).body == RESULT.model_dump_json().encode()
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_model_json_response_bodies_match(monkeypatch, fast):
+    monkeypatch.setattr(settings, "API_FAST_JSON_RESPONSE", fast)
+    response = model_json_response(RESULT)
+    assert isinstance(response, FastJSONResponse) == fast
+    assert json.loads(response.body) == RESULT.model_dump(mode="json")
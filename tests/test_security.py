@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.core import cache as cache_module
+from app.core import security
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    security._token_cache.clear()
+    return calls
+
+
+def test_verified_tokens_are_memoized_until_they_expire(monkeypatch, decode_calls):
+    token = security.create_access_token("foo", timedelta(seconds=60))
+    assert security.decode_access_token(token).sub == "foo"
+    assert security.decode_access_token(token).sub == "foo"
+    assert len(decode_calls) == 1
+
+    now = cache_module.time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 61)
+    security.decode_access_token(token)
+    assert len(decode_calls) == 2
+
+
+def test_invalid_tokens_are_not_memoized(decode_calls):
+    expired = security.create_access_token("foo", timedelta(seconds=-1))
+    for _ in range(2):
+        with pytest.raises(jwt.ExpiredSignatureError):
+            security.decode_access_token(expired)
+    assert len(decode_calls) == 2
+
+    tampered = security.create_access_token("foo", timedelta(seconds=60))[:-2] + "xx"
+    with pytest.raises(jwt.InvalidTokenError):
+        security.decode_access_token(tampered)
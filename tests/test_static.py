@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+from app.utils.static import PrecompressedStaticFiles
+
+
+@pytest.fixture
+def static_files(tmp_path):
+    for name in ("app.css", "app.css.br", "app.css.gz"):
+        (tmp_path / name).write_bytes(name.encode())
+    return PrecompressedStaticFiles(directory=tmp_path, manifest={})
+
+
+def _content_encoding(static_files, accept_encoding: str):
+    scope = {"type": "http", "method": "GET",
+             "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    response = asyncio.run(static_files.get_response("app.css", scope))
+    return response.headers.get("content-encoding")
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;Q=0, gzip", "gzip"),
+    ("br;q=0., gzip", "gzip"),
+    ("*;q=0", None),
+    ("gzip;q=0, *", "br"),
+    ("identity", None),
+])
+def test_serves_the_preferred_variant(static_files, accept_encoding, expected):
+    assert _content_encoding(static_files, accept_encoding) == expected
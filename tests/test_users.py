@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from app.database.crud import UserAlreadyExistsError, create_user, update_user_type
+from app.database.models.user import USER_CHANGED_CHANNEL
+from app.enums import UserType
+
+
+def test_create_user_reports_email_taken_in_another_case(run_db):
+    async def test(db):
+        await create_user(db, "dup", "Dup", "hashed", "dup@example.com")
+        with pytest.raises(UserAlreadyExistsError) as excinfo:
+            await create_user(db, "other", "Other", "hashed", "Dup@Example.com")
+        return excinfo.value.fields
+
+    assert run_db(test) == ["email"]
+
+
+def test_user_changes_are_notified_on_commit(run_db):
+    async def test(db):
+        payloads = []
+        async with db.bind.connect() as listen_connection:
+            raw_connection = await listen_connection.get_raw_connection()
+            await raw_connection.driver_connection.add_listener(
+                USER_CHANGED_CHANNEL, lambda connection, pid, channel, payload: payloads.append(payload))
+
+            await create_user(db, "foo", "Foo", "hashed", "foo@example.com")
+            await update_user_type(db, "foo", UserType.ADMIN)
+            # Rolled back, so never announced.
+            await update_user_type(db, "missing", UserType.ADMIN)
+            await asyncio.sleep(0.5)
+        return payloads
+
+    assert run_db(test) == ["foo", "foo"]